@@ -0,0 +1,63 @@
+"""
+Object (validate_invoices) vs. columnar (validate_columns) validation,
+end to end from parsed JSON records: each engine's load step (Invoice
+models, or InvoiceColumns) is included in its total. "summary-only" is
+`validate --engine columnar --summary-only`; "check x" compares the
+check steps alone (validate_invoices vs. summary-only validate_columns).
+
+The 20x target holds for the check step, not end to end: building the
+columns still reads every field of every record in Python, which bounds
+the end-to-end speedup to roughly 5-8x (and JSON parsing, not measured
+here, comes on top of both).
+
+Run from the repo root (numpy required):
+
+    python benchmarks/bench_columnar.py [N ...]
+"""
+from __future__ import annotations
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from invoice_qc.columnar import InvoiceColumns, validate_columns  # noqa: E402
+from invoice_qc.schema import Invoice  # noqa: E402
+from invoice_qc.validator import validate_invoices  # noqa: E402
+from synthetic import make_records  # noqa: E402
+
+
+def timed(fn) -> tuple[float, object]:
+    start = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - start, out
+
+
+def main(sizes: list[int]) -> None:
+    # both engines start from the parsed JSON records, as `validate` does:
+    # the object engine builds Invoice models, the columnar one columns
+    print(
+        f"{'N':>9} {'object s':>9} {'(load':>7} {'check)':>7} {'columnar s':>16} {'(load':>7} {'check)':>7} "
+        f"{'summary-only s':>16} {'check x':>8}"
+    )
+    for n in sizes:
+        records = make_records(n)
+
+        t_models, invoices = timed(lambda: [Invoice.model_validate(r) for r in records])
+        t_check, expected = timed(lambda: validate_invoices(invoices))
+        t_load, cols = timed(lambda: InvoiceColumns.from_records(records))
+        t_columnar, got = timed(lambda: validate_columns(cols))
+        t_summary, summary_only = timed(lambda: validate_columns(cols, include_results=False))
+        assert got == expected and summary_only["summary"] == expected["summary"]
+
+        t_object = t_models + t_check
+        full, summary = t_load + t_columnar, t_load + t_summary
+        print(
+            f"{n:>9} {t_object:>9.2f} {t_models:>7.2f} {t_check:>7.2f} "
+            f"{full:>9.2f} ({t_object / full:>3.0f}x) {t_load:>7.2f} {t_columnar:>7.2f} "
+            f"{summary:>9.2f} ({t_object / summary:>3.0f}x) {t_check / t_summary:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,86 @@
+"""
+Header field scanning: single-pass scanner vs. one re.search per pattern.
+
+Run from the repo root:
+
+    python benchmarks/bench_header_scan.py
+"""
+from __future__ import annotations
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from invoice_qc.extractor import (  # noqa: E402
+    CURRENCY_CODES,
+    HEADER_FIELD_PATTERNS,
+    _guess_currency,
+    _scan_header_fields,
+)
+
+
+HEADER = """Invoice No: INV-2025-0042
+Invoice Date: 01/12/2025
+Due Date: 15/12/2025
+Seller: ABC Pvt Ltd
+GSTIN: 27ABCDE1234F1Z5
+Buyer: XYZ Traders
+Payment Terms: Net 14 days
+"""
+
+FILLER_LINE = "Item {n} description of goods delivered as per order, qty 2 @ 150.00 = 300.00 INR\n"
+
+
+def make_text(pages: int, lines_per_page: int = 60, header: str = HEADER) -> str:
+    body = "".join(FILLER_LINE.format(n=n) for n in range(lines_per_page))
+    return header + "\n".join(body for _ in range(pages))
+
+
+def legacy_scan(text: str) -> tuple[dict[str, str], str]:
+    """The pre-scanner approach: uncompiled re.search per pattern, in order."""
+    fields: dict[str, str] = {}
+    for field, patterns in HEADER_FIELD_PATTERNS.items():
+        for pat in patterns:
+            m = re.search(pat, text, flags=re.IGNORECASE)
+            if m:
+                fields[field] = m.group("value").strip()
+                break
+    currency = "INR"
+    for code in CURRENCY_CODES:
+        if re.search(rf"\b{code}\b", text):
+            currency = code
+            break
+    return fields, currency
+
+
+def single_pass_scan(text: str) -> tuple[dict[str, str], str]:
+    return _scan_header_fields(text), _guess_currency(text)
+
+
+def main() -> None:
+    cases = [
+        ("all labels on page 1", HEADER),
+        ("no due date / terms", "\n".join(
+            line for line in HEADER.splitlines() if not line.startswith(("Due", "Payment"))
+        ) + "\n"),
+        ("no labels (worst case)", ""),
+    ]
+    print(f"{'case':<26} {'pages':>5} {'legacy us':>11} {'scanner us':>11} {'speedup':>8}")
+    for name, header in cases:
+        for pages in (1, 10, 50):
+            text = make_text(pages, header=header)
+            assert legacy_scan(text) == single_pass_scan(text)
+
+            number = max(5, 2000 // pages)
+            legacy = min(timeit.repeat(lambda: legacy_scan(text), number=number, repeat=3)) / number
+            scanner = min(timeit.repeat(lambda: single_pass_scan(text), number=number, repeat=3)) / number
+            print(
+                f"{name:<26} {pages:>5} {legacy * 1e6:>11.1f} {scanner * 1e6:>11.1f} "
+                f"{legacy / scanner:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Cold-start import cost of the CLI and API, measured with `-X importtime`.
+
+Each target is imported in a fresh interpreter --runs times and the
+median cumulative import time is reported, with the heaviest modules
+it imports directly.
+Exits 1 if a module that must stay lazy is imported at startup (e.g.
+pdfplumber by `invoice_qc.cli`), or if --max-ms is exceeded.
+
+Run from the repo root:
+
+    python benchmarks/bench_startup.py [--runs 7] [--top 8] [--max-ms 400]
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# module -> top-level packages it must not import (they load on first use)
+TARGETS = {
+    "invoice_qc.cli": ("pdfplumber", "pdfminer", "rich", "dateutil", "numpy"),
+    "invoice_qc.api": ("pdfplumber", "pdfminer", "rich", "dateutil", "numpy"),
+}
+
+
+def import_profile(module: str) -> tuple[dict[str, int], list[str]]:
+    """
+    One fresh `import module`: cumulative import time in microseconds per
+    imported module, and the modules `module` imported directly.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    profile: dict[str, int] = {}
+    children: list[str] = []
+    direct: list[str] = []
+    # lines come in post-order, nesting shown by two spaces per level
+    for line in proc.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, field = line[len("import time:"):].split("|")
+        name = field.strip()
+        depth = (len(field) - len(field.lstrip()) - 1) // 2
+        profile[name] = int(cumulative)
+        if depth == 1:
+            children.append(name)
+        elif depth == 0:
+            if name == module:
+                direct = children
+            children = []
+    return profile, direct
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7, help="fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=8, help="heaviest direct imports to list")
+    parser.add_argument("--max-ms", type=float, help="fail if a target's median import time exceeds this")
+    args = parser.parse_args(argv)
+
+    failures: list[str] = []
+    for module, forbidden in TARGETS.items():
+        runs = [import_profile(module) for _ in range(args.runs)]
+        profiles = [profile for profile, _ in runs]
+        total_ms = statistics.median(p[module] for p in profiles) / 1000
+        print(f"{module}: {total_ms:.1f} ms (median of {args.runs})")
+
+        # what the target pulls in itself, heaviest first
+        heaviest = sorted(
+            ((name, statistics.median(p.get(name, 0) for p in profiles) / 1000) for name in runs[-1][1]),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for name, ms in heaviest[: args.top]:
+            print(f"    {ms:8.1f} ms  {name}")
+
+        loaded = {name.split(".")[0] for name in profiles[-1]}
+        for package in forbidden:
+            if package in loaded:
+                failures.append(f"{module} imports {package} at startup")
+        if args.max_ms is not None and total_ms > args.max_ms:
+            failures.append(f"{module}: {total_ms:.1f} ms > --max-ms {args.max_ms}")
+
+    if failures:
+        print("startup regressions:\n  " + "\n  ".join(failures))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+PDF text backends (invoice_qc.text_backends): time and peak memory of
+extracting the text of a corpus with each backend, and whether its text
+matches pdfplumber's.
+
+Without --pdf-dir, a synthetic corpus of text-layer invoices (1 to
+--max-pages pages, see synthetic.make_invoice_pdf) is written to a
+temporary folder. Run from the repo root:
+
+    python benchmarks/bench_text_backends.py [--pdf-dir DIR] [--count 40] [--max-pages 8]
+"""
+from __future__ import annotations
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from invoice_qc.extractor import _extract_text_from_pdf  # noqa: E402
+from invoice_qc.text_backends import DEFAULT_TEXT_BACKEND, text_backend_names  # noqa: E402
+from synthetic import make_invoice_pdf  # noqa: E402
+
+
+def write_corpus(folder: Path, count: int, max_pages: int) -> list[Path]:
+    paths = []
+    for i in range(count):
+        path = folder / f"invoice_{i:05d}.pdf"
+        path.write_bytes(make_invoice_pdf(i, pages=1 + i % max_pages))
+        paths.append(path)
+    return paths
+
+
+def extract_all(paths: list[Path], backend: str) -> dict[str, str]:
+    texts = {}
+    for path in paths:
+        try:
+            texts[path.name] = _extract_text_from_pdf(path, text_backend=backend)
+        except Exception as exc:  # a broken PDF in a real corpus
+            texts[path.name] = f"<error: {exc}>"
+    return texts
+
+
+def peak_memory(path: Path, backend: str) -> int:
+    """Peak bytes allocated by Python while extracting one PDF."""
+    tracemalloc.start()
+    try:
+        _extract_text_from_pdf(path, text_backend=backend)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pdf-dir", help="corpus to extract (default: a synthetic one)")
+    parser.add_argument("--count", type=int, default=40, help="synthetic PDFs to generate")
+    parser.add_argument("--max-pages", type=int, default=8, help="pages of the largest synthetic PDF")
+    parser.add_argument("--repeat", type=int, default=3, help="timed passes per backend (best is reported)")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pdf_dir:
+            paths = sorted(Path(args.pdf_dir).glob("*.pdf"))
+        else:
+            paths = write_corpus(Path(tmp), args.count, args.max_pages)
+        if not paths:
+            print("no PDFs to extract")
+            return 1
+        largest = max(paths, key=lambda path: path.stat().st_size)
+
+        # warm-up: imports and pdfminer's font metric tables
+        for backend in text_backend_names():
+            extract_all(paths[:1], backend)
+
+        reference = extract_all(paths, DEFAULT_TEXT_BACKEND)
+        baseline = None
+        print(f"{len(paths)} PDFs; peak memory measured on {largest.name}")
+        print(f"{'backend':<12} {'s':>8} {'ms/PDF':>8} {'speedup':>8} {'peak MB':>8} {'same text':>10}")
+        for backend in text_backend_names():
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                texts = extract_all(paths, backend)
+                best = min(best, time.perf_counter() - start)
+            if baseline is None:
+                baseline = best
+            same = sum(texts[name] == reference[name] for name in reference)
+            print(
+                f"{backend:<12} {best:>8.3f} {best / len(paths) * 1e3:>8.2f} {baseline / best:>7.1f}x "
+                f"{peak_memory(largest, backend) / 1e6:>8.1f} {same:>5}/{len(paths)}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+Micro-benchmark suite for the parser, utils, validator and serialization
+hot paths.
+
+Every benchmark processes N synthetic inputs and reports throughput
+(ops/sec, best of a few runs) and peak traced memory per op. Results can
+be saved and compared against a saved baseline.
+
+Run from the repo root:
+
+    python benchmarks/run.py                          # default sizes 1, 1k, 100k
+    python benchmarks/run.py --sizes 1,1000,100000,1000000 --only validate_invoices
+    python benchmarks/run.py --save baseline          # -> benchmarks/results/baseline.json
+    python benchmarks/run.py --compare baseline       # show change vs. baseline
+    python benchmarks/run.py --compare baseline --fail-over 15   # exit 1 if >15% slower
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import synthetic  # noqa: E402
+from invoice_qc.extractor import parse_invoice_from_text  # noqa: E402
+from invoice_qc.schema import Invoice  # noqa: E402
+from invoice_qc.serialization import dump_invoices, dumps  # noqa: E402
+from invoice_qc.utils import parse_amount_maybe, parse_date_maybe  # noqa: E402
+from invoice_qc.validator import validate_invoices  # noqa: E402
+
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+# inputs are drawn from a pool of at most this many distinct values, so
+# setup for 1M ops stays cheap while caches still see realistic variety
+POOL_SIZE = 5_000
+
+
+@dataclass
+class Benchmark:
+    """`setup(n)` builds the inputs outside the timed region; `run(inputs)` is timed."""
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    # sizes above this only run when the benchmark is selected with --only
+    max_default_size: int = 1_000_000
+
+
+def _pooled(make: Callable[[int], list], n: int) -> list:
+    pool = make(min(n, POOL_SIZE))
+    return [pool[i % len(pool)] for i in range(n)]
+
+
+def _parse_texts(texts: list[str]) -> None:
+    for text in texts:
+        parse_invoice_from_text(text, source_file="bench.pdf")
+
+
+def _invoice_fields(n: int) -> list[dict]:
+    # typed field values, as the extractor hands them to the constructor
+    return [dict(inv) for inv in synthetic.make_invoices(n)]
+
+
+def _validation_response_inputs(n: int) -> tuple[type, dict, dict]:
+    """ValidationResponse, validate_invoices() output, and that output as report dicts."""
+    from invoice_qc.api import ValidationResponse  # fastapi is slow to import
+
+    result = validate_invoices(synthetic.make_invoices(n))
+    report = {"summary": result["summary"], "results": [r.to_dict() for r in result["results"]]}
+    return ValidationResponse, result, report
+
+
+def _report_dicts(n: int) -> dict:
+    # the report as plain dicts, what json.dumps needs
+    result = validate_invoices(synthetic.make_invoices(n))
+    return {"summary": result["summary"], "results": [r.to_dict() for r in result["results"]]}
+
+
+BENCHMARKS: dict[str, Benchmark] = {
+    "parse_invoice_from_text": Benchmark(
+        setup=lambda n: _pooled(lambda k: [synthetic.make_invoice_text(i) for i in range(k)], n),
+        run=_parse_texts,
+        max_default_size=100_000,
+    ),
+    "parse_amount_maybe": Benchmark(
+        setup=lambda n: _pooled(synthetic.make_amount_strings, n),
+        run=lambda values: [parse_amount_maybe(v) for v in values],
+    ),
+    "parse_date_maybe": Benchmark(
+        setup=lambda n: _pooled(synthetic.make_date_strings, n),
+        run=lambda values: [parse_date_maybe(v) for v in values],
+        max_default_size=100_000,
+    ),
+    "validate_invoices": Benchmark(
+        setup=synthetic.make_invoices,
+        run=validate_invoices,
+    ),
+    "validate_invoices_fail_fast": Benchmark(
+        setup=synthetic.make_invoices,
+        run=lambda invoices: validate_invoices(invoices, mode="fail_fast"),
+    ),
+    # validated vs. unvalidated construction. For Invoice, pydantic-core
+    # validation is faster than model_construct()'s Python loop, so the
+    # extractor keeps the validating constructor; re-check on upgrades.
+    "invoice_validated": Benchmark(
+        setup=_invoice_fields,
+        run=lambda rows: [Invoice(**fields) for fields in rows],
+    ),
+    "invoice_model_construct": Benchmark(
+        setup=_invoice_fields,
+        run=lambda rows: [Invoice.model_construct(**fields) for fields in rows],
+    ),
+    # N = invoices in the response; the API builds it from InvoiceResult
+    # objects with model_construct. Validating construction would not
+    # check those objects at all (pydantic passes stdlib dataclass
+    # instances through), so "validated" builds every InvoiceResult from
+    # its report dict: what checking the results field by field costs.
+    "api_response_validated": Benchmark(
+        setup=_validation_response_inputs,
+        run=lambda args: args[0].model_validate(args[2]),
+    ),
+    "api_response_trusted": Benchmark(
+        setup=_validation_response_inputs,
+        run=lambda args: args[0].model_construct(**args[1]),
+    ),
+    # N = invoices in the report / extracted output
+    "report_json_dumps": Benchmark(
+        setup=_report_dicts,
+        run=lambda result: json.dumps(result, indent=2),
+    ),
+    "report_dumps": Benchmark(
+        setup=lambda n: validate_invoices(synthetic.make_invoices(n)),
+        run=dumps,
+    ),
+    "report_dumps_compact": Benchmark(
+        setup=lambda n: validate_invoices(synthetic.make_invoices(n)),
+        run=lambda result: dumps(result, compact=True),
+    ),
+    "invoices_model_dump_json": Benchmark(
+        setup=synthetic.make_invoices,
+        run=lambda invoices: json.dumps([inv.model_dump(mode="json") for inv in invoices], indent=2),
+    ),
+    "invoices_dump_invoices": Benchmark(
+        setup=synthetic.make_invoices,
+        run=dump_invoices,
+    ),
+}
+
+
+MIN_ROUND_SECONDS = 0.2
+
+
+def _time_round(bench: Benchmark, inputs: Any, loops: int) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for _ in range(loops):
+        bench.run(inputs)
+    return time.perf_counter() - start
+
+
+def measure(bench: Benchmark, n: int, repeat: int) -> dict[str, float]:
+    inputs = bench.setup(n)
+
+    # at small sizes call run() in a loop so timer resolution does not
+    # dominate: grow the loop until one timed round takes >= MIN_ROUND_SECONDS
+    loops = 1
+    while True:
+        elapsed = _time_round(bench, inputs, loops)
+        if elapsed >= MIN_ROUND_SECONDS or loops * n >= 1_000_000:
+            break
+        loops *= 10
+    best = min([elapsed] + [_time_round(bench, inputs, loops) for _ in range(repeat - 1)]) / loops
+
+    gc.collect()
+    tracemalloc.start()
+    bench.run(inputs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"ops_per_sec": n / best, "seconds": best, "peak_bytes": peak, "bytes_per_op": peak / n}
+
+
+def _load(name_or_path: str) -> dict:
+    path = Path(name_or_path)
+    if not path.suffix:
+        path = RESULTS_DIR / f"{name_or_path}.json"
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,1000,100000", help="comma-separated N values")
+    parser.add_argument("--only", action="append", choices=sorted(BENCHMARKS), help="run only these")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per size (best is kept)")
+    parser.add_argument("--save", metavar="NAME", help="save results as benchmarks/results/NAME.json")
+    parser.add_argument("--compare", metavar="NAME", help="baseline name or path to compare against")
+    parser.add_argument("--fail-over", type=float, metavar="PCT", help="exit 1 if any op is PCT%% slower")
+    args = parser.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    baseline = _load(args.compare)["results"] if args.compare else {}
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    regressions = []
+
+    print(f"{'benchmark':<26} {'N':>9} {'ops/sec':>13} {'bytes/op':>10} {'vs base':>9}")
+    for name in args.only or BENCHMARKS:
+        bench = BENCHMARKS[name]
+        results[name] = {}
+        for n in sizes:
+            if n > bench.max_default_size and not args.only:
+                continue
+            stats = measure(bench, n, args.repeat)
+            results[name][str(n)] = stats
+
+            change = ""
+            base = baseline.get(name, {}).get(str(n))
+            if base:
+                pct = (stats["ops_per_sec"] / base["ops_per_sec"] - 1) * 100
+                change = f"{pct:+.1f}%"
+                if args.fail_over is not None and pct < -args.fail_over:
+                    regressions.append(f"{name} N={n}: {pct:+.1f}%")
+            print(f"{name:<26} {n:>9} {stats['ops_per_sec']:>13,.0f} {stats['bytes_per_op']:>10,.0f} {change:>9}")
+
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        out = RESULTS_DIR / f"{args.save}.json"
+        meta = {"python": platform.python_version(), "machine": platform.machine(), "time": time.time()}
+        out.write_text(json.dumps({"meta": meta, "results": results}, indent=2), encoding="utf-8")
+        print(f"saved {out}")
+
+    if regressions:
+        print("regressions:\n  " + "\n  ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Deterministic synthetic inputs shared by the benchmark scripts.
+"""
+from __future__ import annotations
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from invoice_qc.schema import Invoice  # noqa: E402
+
+
+SELLERS = ["ABC Pvt Ltd", "Globex GmbH", "Initech LLC", "Umbrella Corp"]
+BUYERS = ["XYZ Traders", "Acme Retail", "Stark Supplies"]
+CURRENCIES = ["INR", "EUR", "USD", "GBP"]
+
+FILLER_LINE = "Item {n} goods delivered as per purchase order, qty 2 @ 150.00 = 300.00\n"
+
+
+def _invoice_date(i: int) -> date:
+    return date(2024, 1, 1) + timedelta(days=i % 700)
+
+
+def make_invoice_text(i: int, pages: int = 1, lines_per_page: int = 40) -> str:
+    """Plain text as pdfplumber would return it for a simple invoice."""
+    inv_date = _invoice_date(i)
+    net = 1000.0 + (i % 500) * 10
+    tax = round(net * 0.18, 2)
+    header = (
+        f"Invoice No: INV-{i:07d}\n"
+        f"Invoice Date: {inv_date.strftime('%d/%m/%Y')}\n"
+        f"Due Date: {(inv_date + timedelta(days=14)).strftime('%d/%m/%Y')}\n"
+        f"Seller: {SELLERS[i % len(SELLERS)]}\n"
+        f"GSTIN: 27ABCDE{i % 10000:04d}F1Z5\n"
+        f"Buyer: {BUYERS[i % len(BUYERS)]}\n"
+        f"Currency: {CURRENCIES[i % len(CURRENCIES)]}\n"
+        f"Payment Terms: Net 14 days\n"
+    )
+    body = "".join(FILLER_LINE.format(n=n) for n in range(lines_per_page))
+    footer = f"Net Total: {net:,.2f}\nGST 18%: {tax:,.2f}\nGrand Total: {net + tax:,.2f}\n"
+    return header + "\n".join(body for _ in range(pages)) + footer
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_invoice_pdf(i: int, pages: int = 1, lines_per_page: int = 40, rotate: int = 0) -> bytes:
+    """
+    A text-layer PDF (Helvetica, one text line per line of
+    make_invoice_text()), written directly so no PDF library is needed:
+    header fields on page 1, line items, totals on the last page. The
+    item lines are laid out in columns, so text extraction has to merge
+    separately placed strings back into lines. `rotate` sets the pages'
+    /Rotate (the text is laid out the same, then displayed turned).
+    """
+    header, _, rest = make_invoice_text(i, pages=1, lines_per_page=0).partition("Net Total")
+    footer = ("Net Total" + rest).splitlines()
+    streams = []
+    for page in range(pages):
+        ops = ["BT /F1 10 Tf"]
+        y = 800
+        lines = header.splitlines() if page == 0 else []
+        for line in lines:
+            ops.append(f"1 0 0 1 50 {y} Tm ({_pdf_escape(line)}) Tj")
+            y -= 14
+        for n in range(lines_per_page):
+            item = f"Item {page * lines_per_page + n}"
+            cells = (item, "goods delivered as per purchase order", "2", "150.00", "300.00")
+            for x, cell in zip((50, 110, 340, 400, 480), cells):
+                ops.append(f"1 0 0 1 {x} {y} Tm ({cell}) Tj")
+            y -= 14
+        if page == pages - 1:
+            for line in footer:
+                ops.append(f"1 0 0 1 50 {y} Tm ({_pdf_escape(line)}) Tj")
+                y -= 14
+        ops.append("ET")
+        streams.append("\n".join(ops).encode("latin-1"))
+
+    n_pages = len(streams)
+    # objects: 1 catalog, 2 page tree, 3 font, then a page and its content stream per page
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{4 + 2 * k} 0 R".encode() for k in range(n_pages))
+        + f"] /Count {n_pages} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    height = max(842, 14 * (lines_per_page + 30))
+    for k, stream in enumerate(streams):
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 {height}] /Rotate {rotate} "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * k} 0 R >>".encode()
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n".encode() + stream + b"\nendstream")
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{num} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def make_amount_strings(n: int) -> list[str]:
+    samples = ["₹ 1,234.50", "1.234,50", "EUR 99", "Grand Total: 12,345,678.90", "1 234,50", "-42.00", "n/a"]
+    return [samples[i % len(samples)] for i in range(n)]
+
+
+def make_date_strings(n: int) -> list[str]:
+    out = []
+    for i in range(n):
+        d = _invoice_date(i)
+        fmt = ("%Y-%m-%d", "%d/%m/%Y", "%d.%m.%Y", "%d %b %Y")[i % 4]
+        out.append(d.strftime(fmt))
+    return out
+
+
+def make_records(n: int) -> list[dict]:
+    """Mostly valid invoices with ~2% totals mismatches, ~1% bad currency and a few duplicates."""
+    return [
+        {
+            "source_file": f"invoice_{i:07d}.pdf",
+            "invoice_number": f"INV-{i % max(n - 100, 1)}",
+            "invoice_date": _invoice_date(i).isoformat(),
+            "due_date": (_invoice_date(i) + timedelta(days=30)).isoformat(),
+            "seller_name": SELLERS[i % len(SELLERS)],
+            "buyer_name": BUYERS[i % len(BUYERS)],
+            "currency": CURRENCIES[i % len(CURRENCIES)] if i % 97 else "XXX",
+            "net_total": 100.0,
+            "tax_amount": 18.0,
+            "gross_total": 118.0 if i % 50 else 1.0,
+            "line_items": [],
+        }
+        for i in range(n)
+    ]
+
+
+def make_invoices(n: int) -> list[Invoice]:
+    return [Invoice.model_validate(r) for r in make_records(n)]
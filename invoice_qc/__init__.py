@@ -4,8 +4,19 @@ Invoice QC Service package.
 Modules:
 - schema: Pydantic models for Invoice & LineItem
 - extractor: PDF -> Invoice objects
-- validator: Validation rules and summary
-- cli: CLI interface (extract/validate/full-run)
+- text_backends: Pluggable PDF text extraction (pdfplumber, or a faster pdfminer path)
+- cache: Content-addressed on-disk extraction cache
+- manifest: Per-PDF manifest for incremental full-runs
+- duplicate_index: Persistent cross-run duplicate index (SQLite)
+- rules: Validation rule registry, compiled into one pass per invoice
+- validator: Invoice validation and summary
+- sharding: Stable file-name sharding and merging of shard reports
+- timing: Opt-in per-file, per-stage timing and its report summary
+- columnar: Vectorized (NumPy) validation engine for bulk re-validation
+- serialization: Fast (orjson when installed) JSON encoding for reports and output
+- watch: Folder watcher (inotify or polling) feeding a rolling report
+- cli: CLI interface (extract/validate/full-run/watch/merge-reports)
+- metrics: In-process Prometheus metrics for the API
 - api: FastAPI app
 """
 __all__ = ["schema", "extractor", "validator"]
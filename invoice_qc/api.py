@@ -1,22 +1,151 @@
 from __future__ import annotations
-from typing import List, Any, Dict
+import asyncio
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from typing import List, Any, Dict, Optional
 
-from fastapi import FastAPI
-from pydantic import BaseModel
+from fastapi import FastAPI, File, Request, UploadFile
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
 
+from .extractor import _extract_one, _resolve_workers
+from .metrics import CONTENT_TYPE, MetricsMiddleware, ServiceMetrics
+from .rules import default_rules
 from .schema import Invoice
-from .validator import validate_invoices
+from .serialization import dumps
+from .text_backends import DEFAULT_TEXT_BACKEND, get_text_backend
+from .validator import InvoiceResult, StreamingValidation, ValidationMode, validate_invoices
+
+
+# extraction worker processes shared by all requests (0 = one per CPU)
+API_WORKERS = int(os.environ.get("INVOICE_QC_API_WORKERS", "0"))
+# PDF text extraction backend (see text_backends)
+API_TEXT_BACKEND = os.environ.get("INVOICE_QC_TEXT_BACKEND", DEFAULT_TEXT_BACKEND)
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_slots: Optional[asyncio.Semaphore] = None
+
+
+def _get_pool() -> tuple[ProcessPoolExecutor, asyncio.Semaphore]:
+    """
+    Lazily start the extraction pool. The semaphore bounds how many PDFs
+    are queued on it at once, so a burst of uploads waits in the event
+    loop instead of piling up pickled jobs in the pool.
+
+    Workers come from a forkserver (spawn where there is none): forking
+    the server process itself would copy its event loop and threads.
+    """
+    global _pool, _pool_slots
+    if _pool is None:
+        workers = _resolve_workers(API_WORKERS)
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+        _pool_slots = asyncio.Semaphore(workers * 2)
+    return _pool, _pool_slots
+
+
+def _discard_pool(broken: ProcessPoolExecutor) -> None:
+    """
+    Drop a pool whose worker died (OOM kill, segfault in a PDF library):
+    every job on it fails with BrokenProcessPool, so the next upload
+    starts a fresh one. Only the first of the concurrent uploads that hit
+    the failure replaces it.
+    """
+    global _pool, _pool_slots
+    if _pool is broken:
+        _pool, _pool_slots = None, None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _pool, _pool_slots
+    # compile the deployment's rules up front: a bad INVOICE_QC_*_RULES
+    # setting fails startup instead of the first request; likewise the
+    # text backend
+    default_rules()
+    get_text_backend(API_TEXT_BACKEND)
+    yield
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool, _pool_slots = None, None
+
 
 app = FastAPI(
     title="Invoice QC Service",
     version="0.1.0",
     description="Simple Invoice Extraction & Quality Control API",
+    lifespan=lifespan,
 )
 
+metrics = ServiceMetrics()
+app.add_middleware(MetricsMiddleware, metrics=metrics)
+
 
 class ValidationResponse(BaseModel):
     summary: Dict[str, Any]
-    results: List[Dict[str, Any]]
+    results: List[InvoiceResult]
+
+
+class ExtractionResponse(BaseModel):
+    invoices: List[Invoice]
+    failed: List[str]
+
+
+class ExtractAndValidateResponse(ValidationResponse):
+    failed: List[str]
+
+
+def _spool(upload: UploadFile, path: Path) -> None:
+    with path.open("wb") as fh:
+        shutil.copyfileobj(upload.file, fh)
+
+
+async def _extract_upload(upload: UploadFile, path: Path) -> Optional[Invoice]:
+    await run_in_threadpool(_spool, upload, path)
+
+    pool, slots = _get_pool()
+    async with slots:
+        try:
+            inv = await asyncio.get_running_loop().run_in_executor(
+                pool, partial(_extract_one, path, text_backend=API_TEXT_BACKEND)
+            )
+        except BrokenProcessPool:
+            # reported under "failed" like any unreadable PDF
+            logger.warning("Extraction worker died while processing %s", upload.filename or path.name)
+            _discard_pool(pool)
+            return None
+
+    if inv is None:
+        return None
+    return inv.model_copy(update={"source_file": upload.filename or path.name})
+
+
+async def _extract_uploads(files: List[UploadFile]) -> tuple[list[Invoice], list[str]]:
+    """Extract uploaded PDFs concurrently; returns (invoices, names of failed files)."""
+    with tempfile.TemporaryDirectory(prefix="invoice_qc_") as tmp:
+        extracted = await asyncio.gather(
+            *(_extract_upload(upload, Path(tmp) / f"{idx}.pdf") for idx, upload in enumerate(files))
+        )
+
+    invoices = [inv for inv in extracted if inv is not None]
+    failed = [
+        upload.filename or f"upload_{idx}"
+        for idx, (upload, inv) in enumerate(zip(files, extracted))
+        if inv is None
+    ]
+    return invoices, failed
 
 
 @app.get("/health")
@@ -24,10 +153,109 @@ def health():
     return {"status": "ok"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    """Request latency, in-flight requests and validation counters in Prometheus text format."""
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+
 @app.post("/validate-json", response_model=ValidationResponse)
-def validate_json(invoices: List[Invoice]):
+def validate_json(invoices: List[Invoice], mode: ValidationMode = "full"):
     """
     Accepts a list of invoice JSON objects and returns validation summary + per-invoice results.
+    With mode=fail_fast each invoice reports only its first error and duplicates are not checked.
+    """
+    result = validate_invoices(invoices, mode=mode)
+    metrics.record_validation(result["summary"])
+    # our own output: build it without re-validating every result dict
+    return ValidationResponse.model_construct(**result)
+
+
+@app.post("/extract", response_model=ExtractionResponse)
+async def extract(files: List[UploadFile] = File(...)):
+    """
+    Accepts PDF uploads and returns the extracted invoices, in upload order.
+    PDFs that cannot be read are listed in "failed".
     """
-    result = validate_invoices(invoices)
-    return ValidationResponse(**result)
+    invoices, failed = await _extract_uploads(files)
+    return ExtractionResponse.model_construct(invoices=invoices, failed=failed)
+
+
+@app.post("/extract-and-validate", response_model=ExtractAndValidateResponse)
+async def extract_and_validate(files: List[UploadFile] = File(...), mode: ValidationMode = "full"):
+    """
+    Accepts PDF uploads, extracts and validates them, and returns validation
+    summary + per-invoice results. PDFs that cannot be read are listed in "failed".
+    mode=fail_fast works as for /validate-json.
+    """
+    invoices, failed = await _extract_uploads(files)
+    result = await run_in_threadpool(validate_invoices, invoices, mode=mode)
+    metrics.record_validation(result["summary"])
+    return ExtractAndValidateResponse.model_construct(**result, failed=failed)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body is produced while the request body is
+    still being read. The stock class watches for client disconnects by
+    calling receive() in a concurrent task, which would steal request-body
+    chunks from the generator; here a disconnect surfaces through
+    request.stream() (ClientDisconnect) instead.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+@app.post("/validate-ndjson")
+async def validate_ndjson(request: Request, mode: ValidationMode = "full"):
+    """
+    Accepts newline-delimited invoice JSON and streams back one result per
+    line as soon as it is validated, followed by a final {"summary": ...}
+    line. Duplicates are tracked incrementally: each repeat of an earlier
+    invoice key is flagged, the first occurrence is not. Lines that are
+    not valid invoices produce {"line": n, "error": ...} and are counted
+    in "rejected_records". With mode=fail_fast each invoice reports only
+    its first error (rules in declared cost order) and duplicates are not
+    tracked.
+    """
+    return DuplexStreamingResponse(_validate_ndjson_stream(request, mode), media_type="application/x-ndjson")
+
+
+async def _validate_ndjson_stream(request: Request, mode: ValidationMode = "full"):
+    validation = StreamingValidation(mode=mode)
+    rejected = 0
+    line_no = 0
+    pending = b""
+
+    def check_lines(lines: list[bytes]) -> bytes:
+        nonlocal rejected, line_no
+        out: list[bytes] = []
+        for line in lines:
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                inv = Invoice.model_validate_json(line)
+            except ValidationError as exc:
+                rejected += 1
+                out.append(dumps({"line": line_no, "error": exc.errors()[0]["msg"]}, compact=True))
+                continue
+            out.append(dumps(validation.check(inv), compact=True))
+        out.append(b"")
+        return b"\n".join(out)
+
+    # one response chunk per request chunk keeps memory bounded by the
+    # client's chunk size and avoids one tiny send per invoice
+    async for chunk in request.stream():
+        *lines, pending = (pending + chunk).split(b"\n")
+        if lines:
+            yield check_lines(lines)
+    if pending:
+        yield check_lines([pending])
+
+    summary = validation.summary()
+    metrics.record_validation(summary)
+    yield dumps({"summary": summary, "rejected_records": rejected}, compact=True) + b"\n"
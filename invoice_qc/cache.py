@@ -0,0 +1,121 @@
+from __future__ import annotations
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from .schema import Invoice
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "invoice_qc"
+
+
+def content_key(data: bytes, version: str) -> str:
+    """
+    Cache key for one PDF: SHA-256 over the raw bytes plus the extractor
+    version, so bumping the version invalidates every cached entry.
+    """
+    h = hashlib.sha256(data)
+    h.update(b"\0")
+    h.update(version.encode("utf-8"))
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Content-addressed on-disk cache of extracted Invoice objects.
+
+    Layout: <root>/<key[:2]>/<key>.json, one Invoice per file. Hits touch
+    the entry's mtime, so pruning evicts the least recently used entries
+    first until the cache fits in `max_bytes`.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_CACHE_DIR, max_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Invoice]:
+        path = self._path(key)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        try:
+            inv = Invoice.model_validate_json(raw)
+        except ValueError:
+            # corrupt / outdated entry: drop it and treat as a miss
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        self.hits += 1
+        return inv
+
+    def put(self, key: str, invoice: Invoice) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write-then-rename so a crash never leaves a half-written entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(invoice.model_dump_json().encode("utf-8"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) for every cached entry."""
+        entries: list[tuple[float, int, str]] = []
+        if not self.root.exists():
+            return entries
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith(".json"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+
+    def stats(self) -> dict:
+        entries = self._entries()
+        return {
+            "path": str(self.root),
+            "entries": len(entries),
+            "total_bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+        }
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """
+        Evict least recently used entries until the cache fits in
+        `max_bytes` (defaults to the instance limit). Returns the number
+        of entries removed.
+        """
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        if limit is None:
+            return 0
+
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= limit:
+                break
+            Path(path).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        return self.prune(max_bytes=0)
@@ -1,47 +1,197 @@
 from __future__ import annotations
 import json
+import os
+import tempfile
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import typer
-from rich import print
-from rich.console import Console
-from rich.table import Table
+from pydantic import ValidationError
 
-from .extractor import extract_from_dir
+from .cache import DEFAULT_CACHE_DIR, ExtractionCache
+from .duplicate_index import DuplicateIndex
+from .rules import CALIBRATION_SAMPLE, RuleSet, load_rules, registry
 from .schema import Invoice
-from .validator import validate_invoices
+from .serialization import dump_invoices, dumps
+from .sharding import Shard, merge_reports, shard_section
+from .text_backends import DEFAULT_TEXT_BACKEND, get_text_backend
+from .timing import FileTimings, summarize_timings
+from .validator import VALIDATION_MODES, StreamingValidation, scan_duplicate_keys, validate_invoices
 
 
 app = typer.Typer(help="Invoice Extraction & Quality Control CLI")
-console = Console()
+cache_app = typer.Typer(help="Inspect and prune the extraction cache")
+app.add_typer(cache_app, name="cache")
+
+# The extractor (and through it pdfplumber/pdfminer) and rich are
+# imported only by the commands that use them: a cron-style `validate`
+# of a small file would otherwise spend most of its time importing.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from .extractor import PageSelection
+
+
+@lru_cache(maxsize=None)
+def _console() -> Console:
+    from rich.console import Console
+
+    return Console()
+
+
+def _open_cache(cache_dir: Optional[str], cache_max_mb: Optional[float]) -> Optional[ExtractionCache]:
+    if cache_dir is None:
+        return None
+    max_bytes = int(cache_max_mb * 1024 * 1024) if cache_max_mb is not None else None
+    return ExtractionCache(cache_dir, max_bytes=max_bytes)
+
+
+def _parse_pages(pages: str) -> Optional[PageSelection]:
+    from .extractor import PageSelection
+
+    try:
+        return PageSelection.parse(pages)
+    except ValueError as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1)
+
+
+def _parse_shard(shard_index: Optional[int], shard_count: Optional[int]) -> Optional[Shard]:
+    if shard_index is None and shard_count is None:
+        return None
+    if shard_index is None or shard_count is None:
+        typer.echo("--shard-index and --shard-count must be given together")
+        raise typer.Exit(code=1)
+    try:
+        return Shard(shard_index, shard_count)
+    except ValueError as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1)
+
+
+def _check_text_backend(text_backend: str) -> None:
+    try:
+        get_text_backend(text_backend)
+    except ValueError as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1)
+
+
+def _open_dup_index(dup_index: Optional[str]) -> Optional[DuplicateIndex]:
+    return DuplicateIndex(dup_index) if dup_index is not None else None
+
+
+def _load_rules(timed: bool = False) -> RuleSet:
+    try:
+        return load_rules(timed=timed)
+    except (ImportError, ValueError) as exc:
+        typer.echo(f"Invalid rule configuration: {exc}")
+        raise typer.Exit(code=1)
+
+
+def _check_mode(mode: str, dup_index: Optional[str]) -> None:
+    if mode not in VALIDATION_MODES:
+        typer.echo(f"Unknown mode: {mode} (expected full or fail_fast)")
+        raise typer.Exit(code=1)
+    if mode == "fail_fast" and dup_index is not None:
+        typer.echo("--dup-index is not supported with --mode fail_fast (duplicates are not checked)")
+        raise typer.Exit(code=1)
+
+
+def _timings_summary(file_timings: list[FileTimings], rules: RuleSet) -> dict:
+    summary = summarize_timings(file_timings)
+    summary["rules"] = rules.counters()
+    return summary
 
 
 @app.command()
 def extract(
     pdf_dir: str = typer.Option(..., help="Folder containing invoice PDFs"),
     output: str = typer.Option("extracted_invoices.json", help="Output JSON file path"),
+    fmt: str = typer.Option(
+        "json", "--format", help="json (one array) or jsonl (one invoice per line, written as extracted)"
+    ),
+    workers: int = typer.Option(1, help="Extraction worker processes (0 = one per CPU)"),
+    cache_dir: Optional[str] = typer.Option(None, help="Extraction cache directory (disabled if omitted)"),
+    cache_max_mb: Optional[float] = typer.Option(None, help="Evict cache entries beyond this size (MB)"),
+    pages: str = typer.Option(
+        "all", help="'all', or 'N:M' to read the first N and last M pages (full document if fields are missing)"
+    ),
+    compact: bool = typer.Option(False, help="Write JSON without indentation (smaller and faster to write)"),
+    shard_index: Optional[int] = typer.Option(
+        None, help="Only process the PDFs of this shard (0-based; see --shard-count)"
+    ),
+    shard_count: Optional[int] = typer.Option(
+        None, help="Split the folder into this many shards by a stable hash of the file name"
+    ),
+    text_backend: str = typer.Option(
+        DEFAULT_TEXT_BACKEND,
+        help="PDF text extraction: pdfplumber, or pdfminer (same text for plain text-layer PDFs, several times faster)",
+    ),
 ):
-    """Extract structured invoices from PDFs and save to JSON."""
+    """Extract structured invoices from PDFs and save to JSON or JSONL."""
+    from .extractor import extract_from_dir, iter_extract_from_dir
+
     pdf_path = Path(pdf_dir)
     if not pdf_path.exists():
         typer.echo(f"PDF directory not found: {pdf_dir}")
         raise typer.Exit(code=1)
 
-    invoices = extract_from_dir(pdf_path)
-    data = [inv.model_dump() for inv in invoices]
+    if fmt not in ("json", "jsonl"):
+        typer.echo(f"Unknown format: {fmt} (expected json or jsonl)")
+        raise typer.Exit(code=1)
 
+    shard = _parse_shard(shard_index, shard_count)
+    _check_text_backend(text_backend)
+    page_selection = _parse_pages(pages)
+    cache = _open_cache(cache_dir, cache_max_mb)
     out_path = Path(output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
 
-    print(f"[green]Extracted {len(invoices)} invoices[/green] → {out_path}")
+    if fmt == "jsonl":
+        # one record per line, flushed as we go: constant memory, and a
+        # crash leaves every invoice extracted so far on disk
+        count = 0
+        with out_path.open("w", encoding="utf-8") as fh:
+            for inv in iter_extract_from_dir(
+                pdf_path, workers=workers, cache=cache, pages=page_selection, shard=shard, text_backend=text_backend
+            ):
+                fh.write(inv.model_dump_json() + "\n")
+                fh.flush()
+                count += 1
+        _console().print(f"[green]Extracted {count} invoices[/green] → {out_path}")
+        return
+
+    invoices = extract_from_dir(
+        pdf_path, workers=workers, cache=cache, pages=page_selection, shard=shard, text_backend=text_backend
+    )
+    out_path.write_bytes(dump_invoices(invoices, compact=compact))
+
+    _console().print(f"[green]Extracted {len(invoices)} invoices[/green] → {out_path}")
 
 
 @app.command()
 def validate(
-    input: str = typer.Option(..., help="Input JSON file with extracted invoices"),
+    input: str = typer.Option(..., help="Input JSON or JSONL (.jsonl/.ndjson) file with extracted invoices"),
     report: str = typer.Option("validation_report.json", help="Validation report output file"),
+    dup_index: Optional[str] = typer.Option(
+        None, help="SQLite file of invoice keys from earlier runs; flags and records cross-run duplicates"
+    ),
+    engine: str = typer.Option(
+        "object", help="object (per-invoice checks) or columnar (vectorized, needs numpy; loads the whole file)"
+    ),
+    timings: bool = typer.Option(
+        False, help="Record per-invoice and per-rule validation time and add it to the report summary"
+    ),
+    mode: str = typer.Option(
+        "full", help="full (every error) or fail_fast (first error per invoice, no duplicate checks)"
+    ),
+    compact: bool = typer.Option(False, help="Write JSON without indentation (smaller and faster to write)"),
+    summary_only: bool = typer.Option(
+        False, help="Write only the summary, no per-invoice results (--engine columnar; skips building them)"
+    ),
 ):
     """Validate invoices from JSON and save QC report."""
     in_path = Path(input)
@@ -49,14 +199,63 @@ def validate(
         typer.echo(f"Input file not found: {input}")
         raise typer.Exit(code=1)
 
-    raw = json.loads(in_path.read_text(encoding="utf-8"))
-    invoices = [Invoice.model_validate(x) for x in raw]
+    if engine not in ("object", "columnar"):
+        typer.echo(f"Unknown engine: {engine} (expected object or columnar)")
+        raise typer.Exit(code=1)
+
+    _check_mode(mode, dup_index)
+    if summary_only and engine != "columnar":
+        typer.echo("--summary-only is only supported with --engine columnar")
+        raise typer.Exit(code=1)
 
-    result = validate_invoices(invoices)
+    if engine == "columnar":
+        for flag, value in (
+            ("--dup-index", dup_index is not None),
+            ("--timings", timings),
+            ("--mode fail_fast", mode == "fail_fast"),
+        ):
+            if value:
+                typer.echo(f"{flag} is not supported with --engine columnar")
+                raise typer.Exit(code=1)
+        result = _validate_columnar(in_path, _load_rules(), include_results=not summary_only)
+    elif in_path.suffix.lower() in JSONL_SUFFIXES:
+        rules = _load_rules(timed=timings)
+        index = _open_dup_index(dup_index)
+        try:
+            summary = _validate_jsonl_streaming(
+                in_path,
+                Path(report),
+                duplicate_index=index,
+                timings=timings,
+                compact=compact,
+                rules=rules,
+                mode=mode,
+            )
+        except ValueError as exc:
+            typer.echo(str(exc))
+            raise typer.Exit(code=1)
+        finally:
+            if index is not None:
+                index.close()
+        _print_summary(summary)
+        if summary["invalid_invoices"] > 0:
+            raise typer.Exit(code=2)
+        return
+    else:
+        rules = _load_rules(timed=timings)
+        raw = json.loads(in_path.read_text(encoding="utf-8"))
+        invoices = [Invoice.model_validate(x) for x in raw]
+        if mode == "fail_fast":
+            rules = rules.fail_fast(invoices[:CALIBRATION_SAMPLE])
+
+        file_timings = [FileTimings(inv.source_file) for inv in invoices] if timings else None
+        result = _validate_with_index(invoices, dup_index, timings=file_timings, rules=rules, mode=mode)
+        if file_timings is not None:
+            result["summary"]["timings"] = _timings_summary(file_timings, rules)
 
     report_path = Path(report)
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    report_path.write_bytes(dumps(result, compact=compact))
 
     _print_summary(result["summary"])
 
@@ -69,14 +268,90 @@ def validate(
 def full_run(
     pdf_dir: str = typer.Option(..., help="Folder containing invoice PDFs"),
     report: str = typer.Option("validation_report.json", help="Validation report output file"),
+    workers: int = typer.Option(1, help="Extraction worker processes (0 = one per CPU)"),
+    cache_dir: Optional[str] = typer.Option(None, help="Extraction cache directory (disabled if omitted)"),
+    cache_max_mb: Optional[float] = typer.Option(None, help="Evict cache entries beyond this size (MB)"),
+    pages: str = typer.Option(
+        "all", help="'all', or 'N:M' to read the first N and last M pages (full document if fields are missing)"
+    ),
+    dup_index: Optional[str] = typer.Option(
+        None, help="SQLite file of invoice keys from earlier runs; flags and records cross-run duplicates"
+    ),
+    timings: bool = typer.Option(
+        False, help="Record per-file, per-stage wall/CPU time and per-rule time and add them to the report summary"
+    ),
+    mode: str = typer.Option(
+        "full", help="full (every error) or fail_fast (first error per invoice, no duplicate checks)"
+    ),
+    compact: bool = typer.Option(False, help="Write JSON without indentation (smaller and faster to write)"),
+    incremental: bool = typer.Option(
+        False,
+        help="Only extract PDFs that are new or changed since the last run with this report "
+        "(tracked in <report>.manifest.jsonl)",
+    ),
+    shard_index: Optional[int] = typer.Option(
+        None,
+        help="Only process the PDFs of this shard (0-based; see --shard-count); combine the reports with merge-reports",
+    ),
+    shard_count: Optional[int] = typer.Option(
+        None, help="Split the folder into this many shards by a stable hash of the file name"
+    ),
+    text_backend: str = typer.Option(
+        DEFAULT_TEXT_BACKEND,
+        help="PDF text extraction: pdfplumber, or pdfminer (same text for plain text-layer PDFs, several times faster)",
+    ),
 ):
     """Extract from PDFs and validate in a single step."""
-    invoices = extract_from_dir(pdf_dir)
-    result = validate_invoices(invoices)
+    from .extractor import extract_from_dir
 
+    _check_mode(mode, dup_index)
+    if incremental and dup_index is not None:
+        typer.echo("--dup-index is not supported with --incremental (unchanged invoices would count as seen before)")
+        raise typer.Exit(code=1)
+    shard = _parse_shard(shard_index, shard_count)
+    _check_text_backend(text_backend)
+    rules = _load_rules(timed=timings)
     report_path = Path(report)
+    page_selection = _parse_pages(pages)
+    cache = _open_cache(cache_dir, cache_max_mb)
+    file_timings: Optional[list[FileTimings]] = [] if timings else None
+    if incremental:
+        invoices = _extract_incremental(
+            Path(pdf_dir),
+            report_path,
+            workers=workers,
+            cache=cache,
+            pages=page_selection,
+            timings=file_timings,
+            shard=shard,
+            text_backend=text_backend,
+        )
+    else:
+        invoices = extract_from_dir(
+            pdf_dir,
+            workers=workers,
+            cache=cache,
+            pages=page_selection,
+            timings=file_timings,
+            shard=shard,
+            text_backend=text_backend,
+        )
+
+    invoice_timings = None
+    if file_timings is not None:
+        by_file = {t.source_file: t for t in file_timings}
+        # invoices carried over by --incremental were not timed this run
+        invoice_timings = [by_file.get(inv.source_file) or FileTimings(inv.source_file) for inv in invoices]
+    if mode == "fail_fast":
+        rules = rules.fail_fast(invoices[:CALIBRATION_SAMPLE])
+    result = _validate_with_index(invoices, dup_index, timings=invoice_timings, rules=rules, mode=mode)
+    if file_timings is not None:
+        result["summary"]["timings"] = _timings_summary(file_timings, rules)
+    if shard is not None:
+        result.update(shard_section(shard, invoices))
+
     report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    report_path.write_bytes(dumps(result, compact=compact))
 
     _print_summary(result["summary"])
 
@@ -84,8 +359,315 @@ def full_run(
         raise typer.Exit(code=2)
 
 
+@cache_app.command("info")
+def cache_info(
+    cache_dir: str = typer.Option(str(DEFAULT_CACHE_DIR), help="Extraction cache directory"),
+):
+    """Show size and entry count of the extraction cache."""
+    from rich.table import Table
+
+    stats = ExtractionCache(cache_dir).stats()
+
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("Metric")
+    table.add_column("Value")
+    table.add_row("Path", stats["path"])
+    table.add_row("Entries", str(stats["entries"]))
+    table.add_row("Size (MB)", f"{stats['total_bytes'] / (1024 * 1024):.2f}")
+    _console().print(table)
+
+
+@cache_app.command("prune")
+def cache_prune(
+    cache_dir: str = typer.Option(str(DEFAULT_CACHE_DIR), help="Extraction cache directory"),
+    max_mb: float = typer.Option(0.0, help="Keep at most this many MB (0 = clear everything)"),
+):
+    """Evict least recently used cache entries down to --max-mb."""
+    cache = ExtractionCache(cache_dir)
+    removed = cache.prune(max_bytes=int(max_mb * 1024 * 1024))
+    _console().print(f"[green]Removed {removed} cache entries[/green] from {cache.root}")
+
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+
+def _iter_jsonl_invoices(path: Path) -> Iterator[Invoice]:
+    """Invoices of a JSONL file; ValueError names the first bad line."""
+    with path.open("r", encoding="utf-8") as fh:
+        for lineno, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield Invoice.model_validate_json(line)
+            except ValidationError as exc:
+                error = exc.errors(include_url=False)[0]
+                field = ".".join(str(part) for part in error["loc"])
+                problem = f"{field}: {error['msg']}" if field else error["msg"]
+                raise ValueError(f"{path}, line {lineno}: {problem}") from None
+
+
+def _extract_incremental(
+    pdf_dir: Path,
+    report_path: Path,
+    workers: int,
+    cache: Optional[ExtractionCache],
+    pages: Optional[PageSelection],
+    timings: Optional[list[FileTimings]],
+    shard: Optional[Shard] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> list[Invoice]:
+    """
+    Extract only the PDFs that changed since the manifest beside
+    `report_path` was written, and return every invoice of the folder
+    (of `shard`, if given).
+    """
+    from .extractor import extraction_version, iter_extract_paths
+    from .manifest import RunManifest, manifest_path
+
+    path = manifest_path(report_path)
+    manifest = RunManifest.load(path, extraction_version(pages, text_backend))
+    pdf_paths = sorted(pdf_dir.glob("*.pdf"))
+    if shard is not None:
+        pdf_paths = [pdf_path for pdf_path in pdf_paths if shard.contains(pdf_path.name)]
+    to_extract, removed = manifest.diff(pdf_paths)
+    extracted = {
+        inv.source_file: inv
+        for inv in iter_extract_paths(
+            to_extract, workers=workers, cache=cache, pages=pages, timings=timings, text_backend=text_backend
+        )
+    }
+    for pdf_path in to_extract:
+        manifest.record(pdf_path.name, extracted.get(pdf_path.name))
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest.save(path)
+
+    _console().print(
+        f"Incremental run: {len(to_extract)} extracted, "
+        f"{len(manifest.entries) - len(to_extract)} unchanged, {len(removed)} removed"
+    )
+    return manifest.invoices()
+
+
+def _validate_columnar(in_path: Path, rules: RuleSet, include_results: bool = True) -> dict:
+    # records go straight into columns, skipping per-invoice pydantic models
+    from .columnar import InvoiceColumns, _gc_paused, validate_columns
+
+    # parsing creates one dict per invoice, none in a cycle: without the
+    # pause the cyclic GC walks them all over and over
+    with in_path.open("r", encoding="utf-8") as fh, _gc_paused():
+        if in_path.suffix.lower() in JSONL_SUFFIXES:
+            records = []
+            for lineno, line in enumerate(fh, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError as exc:
+                    typer.echo(f"{in_path}, line {lineno}: invalid JSON: {exc}")
+                    raise typer.Exit(code=1)
+        else:
+            records = json.load(fh)
+    try:
+        return validate_columns(InvoiceColumns.from_records(records), include_results=include_results, rules=rules)
+    except ValueError as exc:
+        typer.echo(str(exc))
+        raise typer.Exit(code=1)
+
+
+def _validate_with_index(
+    invoices: list[Invoice],
+    dup_index: Optional[str],
+    timings: Optional[list[FileTimings]] = None,
+    rules: Optional[RuleSet] = None,
+    mode: str = "full",
+) -> dict:
+    index = _open_dup_index(dup_index)
+    try:
+        return validate_invoices(invoices, duplicate_index=index, timings=timings, rules=rules, mode=mode)
+    finally:
+        if index is not None:
+            index.close()
+
+
+def _validate_jsonl_streaming(
+    in_path: Path,
+    report_path: Path,
+    duplicate_index: Optional[DuplicateIndex] = None,
+    timings: bool = False,
+    compact: bool = False,
+    rules: Optional[RuleSet] = None,
+    mode: str = "full",
+) -> dict:
+    """
+    Validate a JSONL file in two streaming passes (duplicate keys, then
+    checks; in fail_fast mode only the second) and stream the report to
+    disk. Memory holds one invoice plus
+    the duplicate digests and error counts (and, with `timings`, one
+    FileTimings per invoice). The report has the same keys as the
+    in-memory path, with "results" written before "summary".
+    """
+    file_timings: Optional[list[FileTimings]] = [] if timings else None
+    if mode == "fail_fast":
+        # one pass: no duplicate keys to collect first
+        if rules is None:
+            rules = load_rules()
+        sample = list(islice(_iter_jsonl_invoices(in_path), CALIBRATION_SAMPLE))
+        validation = StreamingValidation(rules=rules.fail_fast(sample), mode=mode)
+    else:
+        validation = StreamingValidation(
+            scan_duplicate_keys(_iter_jsonl_invoices(in_path)), duplicate_index=duplicate_index, rules=rules
+        )
+
+    if compact:
+        head, first, sep, middle, tail = b'{"results":[', b"", b",", b'],"summary":', b"}\n"
+    else:
+        head, first, sep, middle, tail = b'{\n  "results": [', b"\n    ", b",\n    ", b'\n  ],\n  "summary": ', b"\n}\n"
+
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    # written next to the report and renamed once complete: a bad line
+    # or a crash halfway leaves any previous report intact
+    fd, tmp = tempfile.mkstemp(dir=report_path.parent, prefix=f".{report_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(head)
+            results = validation.iter_results(_iter_jsonl_invoices(in_path), timings=file_timings)
+            for idx, result in enumerate(results):
+                fh.write(sep if idx else first)
+                fh.write(dumps(result, compact=True))
+            summary = validation.summary()
+            if file_timings is not None:
+                summary["timings"] = _timings_summary(file_timings, validation.rules)
+            fh.write(middle)
+            fh.write(dumps(summary, compact=compact).replace(b"\n", b"\n  "))
+            fh.write(tail)
+        os.replace(tmp, report_path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+    return summary
+
+
+@app.command()
+def watch(
+    pdf_dir: str = typer.Option(..., help="Folder to watch for invoice PDFs"),
+    report: str = typer.Option("validation_report.jsonl", help="Rolling JSONL report the results are appended to"),
+    report_max_mb: Optional[float] = typer.Option(
+        None, help="Roll the report over to <report>.1 (keeping 3 old ones) beyond this size (MB)"
+    ),
+    workers: int = typer.Option(1, help="Extraction worker processes, kept for the whole watch (0 = one per CPU)"),
+    cache_dir: Optional[str] = typer.Option(None, help="Extraction cache directory (disabled if omitted)"),
+    cache_max_mb: Optional[float] = typer.Option(None, help="Evict cache entries beyond this size (MB)"),
+    pages: str = typer.Option(
+        "all", help="'all', or 'N:M' to read the first N and last M pages (full document if fields are missing)"
+    ),
+    dup_index: Optional[str] = typer.Option(
+        None, help="SQLite file of invoice keys; flags duplicates across batches and earlier runs"
+    ),
+    mode: str = typer.Option(
+        "full", help="full (every error) or fail_fast (first error per invoice, no duplicate checks)"
+    ),
+    initial_scan: bool = typer.Option(
+        True, help="Process the PDFs already in the folder on startup, unless unchanged since the last watch"
+    ),
+    poll: bool = typer.Option(False, help="Poll the folder instead of using inotify"),
+    poll_interval: float = typer.Option(2.0, help="Seconds between folder listings when polling"),
+    text_backend: str = typer.Option(
+        DEFAULT_TEXT_BACKEND,
+        help="PDF text extraction: pdfplumber, or pdfminer (same text for plain text-layer PDFs, several times faster)",
+    ),
+):
+    """Watch a folder and extract + validate new or changed PDFs as they arrive."""
+    from .watch import FolderWatch, RollingReport
+
+    folder = Path(pdf_dir)
+    if not folder.is_dir():
+        typer.echo(f"Folder not found: {pdf_dir}")
+        raise typer.Exit(code=1)
+    _check_mode(mode, dup_index)
+    _check_text_backend(text_backend)
+
+    def on_batch(summary: dict) -> None:
+        _console().print(
+            f"{summary['total_invoices']} invoices, "
+            f"[{'red' if summary['invalid_invoices'] else 'green'}]{summary['invalid_invoices']} invalid[/] → {report}"
+        )
+
+    max_bytes = int(report_max_mb * 1024 * 1024) if report_max_mb is not None else None
+    index = _open_dup_index(dup_index)
+    folder_watch = FolderWatch(
+        folder,
+        RollingReport(Path(report), max_bytes=max_bytes),
+        workers=workers,
+        cache=_open_cache(cache_dir, cache_max_mb),
+        pages=_parse_pages(pages),
+        rules=_load_rules(),
+        mode=mode,
+        duplicate_index=index,
+        on_batch=on_batch,
+        text_backend=text_backend,
+    )
+    _console().print(f"Watching {folder} (Ctrl-C to stop)")
+    try:
+        folder_watch.run(initial_scan=initial_scan, poll_interval=poll_interval, polling=poll)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        folder_watch.close()
+        if index is not None:
+            index.close()
+
+
+@app.command("merge-reports")
+def merge_reports_command(
+    reports: list[str] = typer.Argument(
+        ..., help="Reports of full-run with --shard-index/--shard-count, one per shard"
+    ),
+    output: str = typer.Option("validation_report.json", help="Merged report output file"),
+    compact: bool = typer.Option(False, help="Write JSON without indentation (smaller and faster to write)"),
+):
+    """Combine the shard reports of one run into a single report and summary."""
+    loaded = []
+    for report in reports:
+        try:
+            loaded.append(json.loads(Path(report).read_bytes()))
+        except (OSError, ValueError) as exc:
+            typer.echo(f"Cannot read report {report}: {exc}")
+            raise typer.Exit(code=1)
+    try:
+        result = merge_reports(loaded)
+    except ValueError as exc:
+        typer.echo(f"Cannot merge reports: {exc}")
+        raise typer.Exit(code=1)
+
+    out_path = Path(output)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_bytes(dumps(result, compact=compact))
+
+    _print_summary(result["summary"])
+
+    if result["summary"]["invalid_invoices"] > 0:
+        raise typer.Exit(code=2)
+
+
+@app.command("rules")
+def list_rules():
+    """List the registered validation rules and which ones this deployment runs."""
+    from rich.table import Table
+
+    enabled = set(_load_rules().names)
+    table = Table(show_header=True, header_style="bold magenta")
+    for column in ("Rule", "Fields", "Cost", "Enabled"):
+        table.add_column(column)
+    for rule in registry.rules():
+        table.add_row(rule.name, ", ".join(rule.fields), rule.cost, "yes" if rule.name in enabled else "no")
+    _console().print(table)
+
+
 def _print_summary(summary: dict):
-    console.print("\n[bold]Validation Summary[/bold]")
+    from rich.table import Table
+
+    _console().print("\n[bold]Validation Summary[/bold]")
     table = Table(show_header=True, header_style="bold magenta")
     table.add_column("Metric")
     table.add_column("Value")
@@ -94,10 +676,13 @@ def _print_summary(summary: dict):
     table.add_row("Valid invoices", str(summary["valid_invoices"]))
     table.add_row("Invalid invoices", str(summary["invalid_invoices"]))
 
-    console.print(table)
+    _console().print(table)
 
     if summary["error_counts"]:
-        console.print("\n[bold]Top error types[/bold]")
+        if summary.get("mode") == "fail_fast":
+            _console().print("\n[bold]First error per invalid invoice[/bold] (fail-fast: later errors not checked)")
+        else:
+            _console().print("\n[bold]Top error types[/bold]")
         err_table = Table(show_header=True, header_style="bold red")
         err_table.add_column("Error")
         err_table.add_column("Count")
@@ -105,7 +690,48 @@ def _print_summary(summary: dict):
         for err, count in summary["error_counts"].items():
             err_table.add_row(err, str(count))
 
-        console.print(err_table)
+        _console().print(err_table)
+
+    if "timings" in summary:
+        _print_timings(summary["timings"])
+
+
+def _print_timings(timings: dict):
+    from rich.table import Table
+
+    _console().print("\n[bold]Stage timings (seconds)[/bold]")
+    table = Table(show_header=True, header_style="bold cyan")
+    for column in ("Stage", "Files", "Wall p50", "Wall p95", "Wall max", "CPU p50", "CPU p95", "CPU max"):
+        table.add_column(column)
+    for name, stats in timings["stages"].items():
+        table.add_row(
+            name,
+            str(stats["files"]),
+            *(f"{stats[key]:.4f}" for key in ("wall_p50", "wall_p95", "wall_max", "cpu_p50", "cpu_p95", "cpu_max")),
+        )
+    _console().print(table)
+
+    if timings.get("rules"):
+        _console().print("\n[bold]Rule timings[/bold]")
+        rule_table = Table(show_header=True, header_style="bold cyan")
+        for column in ("Rule", "Calls", "Failures", "Total (s)", "Per call (µs)"):
+            rule_table.add_column(column)
+        for name, stats in timings["rules"].items():
+            per_call = stats["seconds"] / stats["calls"] * 1e6 if stats["calls"] else 0.0
+            rule_table.add_row(
+                name, str(stats["calls"]), str(stats["failures"]), f"{stats['seconds']:.4f}", f"{per_call:.2f}"
+            )
+        _console().print(rule_table)
+
+    _console().print("\n[bold]Slowest files[/bold]")
+    slow_table = Table(show_header=True, header_style="bold cyan")
+    slow_table.add_column("File")
+    slow_table.add_column("Wall (s)")
+    slow_table.add_column("Slowest stage")
+    for entry in timings["slowest_files"]:
+        slowest_stage = max(entry["stages"], key=entry["stages"].get) if entry["stages"] else "-"
+        slow_table.add_row(entry["source_file"], f"{entry['wall']:.4f}", slowest_stage)
+    _console().print(slow_table)
 
 
 if __name__ == "__main__":
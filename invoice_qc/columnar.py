@@ -0,0 +1,321 @@
+from __future__ import annotations
+import gc
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .rules import ALLOWED_CURRENCIES, EPSILON, RuleSet, default_rules, invalid_currency_message
+from .schema import Invoice
+from .validator import DUPLICATE_INVOICE, InvoiceResult, _build_summary
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only this engine needs it
+    np = None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("the columnar validation engine requires numpy (pip install numpy)")
+
+
+@dataclass
+class InvoiceColumns:
+    """
+    Column-oriented view of a batch of invoices: one NumPy array per field
+    the validation rules read (strings as fixed-width unicode arrays,
+    dates as datetime64[D] with NaT for a missing due date). Build it with
+    from_records() straight from JSON dicts to skip per-invoice pydantic
+    construction entirely.
+    """
+    source_file: "np.ndarray"
+    invoice_number: "np.ndarray"
+    seller_name: "np.ndarray"
+    buyer_name: "np.ndarray"
+    currency: "np.ndarray"
+    invoice_date: "np.ndarray"
+    due_date: "np.ndarray"
+    net_total: "np.ndarray"
+    tax_amount: "np.ndarray"
+    gross_total: "np.ndarray"
+    has_line_items: "np.ndarray"
+    line_items_sum: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.invoice_number)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> InvoiceColumns:
+        """
+        Build columns from Invoice-shaped dicts (e.g. a parsed JSON report).
+
+        No Invoice models are built, so the required fields are checked
+        here instead: ValueError names the first record with a required
+        field missing, null, or not a number/date, as Invoice validation
+        would have rejected it (a NaT or NaN would otherwise fail no mask
+        and pass silently).
+        """
+        _require_numpy()
+        records = records if isinstance(records, list) else list(records)
+
+        def col(field: str, dtype: Any = str, required: bool = True) -> "np.ndarray":
+            # itemgetter over the list in C: a missing key raises instead
+            # of reading as None
+            try:
+                values = list(map(itemgetter(field), records)) if required else [r.get(field) for r in records]
+            except KeyError:
+                row = next(i for i, r in enumerate(records) if field not in r)
+                raise ValueError(_record_error(records, row, f"missing required field {field!r}")) from None
+            if dtype is str and None in values:
+                raise ValueError(_record_error(records, values.index(None), f"{field} is null"))
+            try:
+                column = np.array(values, dtype=dtype)
+            except (TypeError, ValueError):
+                row = next(i for i, v in enumerate(values) if not _converts(v, dtype))
+                kind = "date" if dtype != float else "number"
+                raise ValueError(_record_error(records, row, f"{field} {values[row]!r} is not a {kind}")) from None
+            if required and dtype is not str:
+                missing = np.flatnonzero(np.isnat(column) if column.dtype.kind == "M" else np.isnan(column))
+                if len(missing):
+                    row = int(missing[0])
+                    value = "null" if values[row] is None else repr(values[row])
+                    raise ValueError(_record_error(records, row, f"{field} is {value}"))
+            return column
+
+        line_items = [r.get("line_items") or () for r in records]
+        try:
+            line_items_sum = np.array(
+                [sum([li["line_total"] for li in items]) if items else 0.0 for items in line_items], dtype=float
+            )
+        except (KeyError, TypeError):
+            row = next(i for i, items in enumerate(line_items) if not _line_totals_sum(items))
+            raise ValueError(_record_error(records, row, "line_items without a numeric line_total")) from None
+        return cls(
+            source_file=col("source_file"),
+            invoice_number=col("invoice_number"),
+            seller_name=col("seller_name"),
+            buyer_name=col("buyer_name"),
+            currency=col("currency"),
+            invoice_date=col("invoice_date", dtype="datetime64[D]"),
+            due_date=col("due_date", dtype="datetime64[D]", required=False),
+            net_total=col("net_total", dtype=float),
+            tax_amount=col("tax_amount", dtype=float),
+            gross_total=col("gross_total", dtype=float),
+            has_line_items=np.fromiter(map(bool, line_items), dtype=bool, count=len(line_items)),
+            line_items_sum=line_items_sum,
+        )
+
+    @classmethod
+    def from_invoices(cls, invoices: List[Invoice]) -> InvoiceColumns:
+        _require_numpy()
+        return cls.from_records(
+            {
+                "source_file": inv.source_file,
+                "invoice_number": inv.invoice_number,
+                "seller_name": inv.seller_name,
+                "buyer_name": inv.buyer_name,
+                "currency": inv.currency,
+                "invoice_date": inv.invoice_date,
+                "due_date": inv.due_date,
+                "net_total": inv.net_total,
+                "tax_amount": inv.tax_amount,
+                "gross_total": inv.gross_total,
+                "line_items": [{"line_total": li.line_total} for li in inv.line_items],
+            }
+            for inv in invoices
+        )
+
+
+def _record_error(records: List[Dict[str, Any]], row: int, problem: str) -> str:
+    source = records[row].get("source_file") if isinstance(records[row], dict) else None
+    return f"record {row}" + (f" ({source})" if source else "") + f": {problem}"
+
+
+def _converts(value: Any, dtype: Any) -> bool:
+    try:
+        np.array([value], dtype=dtype)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _line_totals_sum(items: Any) -> bool:
+    try:
+        sum(li["line_total"] for li in items)
+    except (KeyError, TypeError):
+        return False
+    return True
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Building a million small dicts/lists triggers the cyclic GC over and
+    over (each pass walking the whole heap); none of them form cycles.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _blank(values: "np.ndarray") -> "np.ndarray":
+    """Vectorized `not value.strip()`."""
+    return np.char.isspace(values) | (np.char.str_len(values) == 0)
+
+
+def _string_hash(values: "np.ndarray") -> "np.ndarray":
+    """64-bit polynomial hash over the code points of a unicode array."""
+    codepoints = values.view(np.uint32).reshape(len(values), -1)
+    h = np.zeros(len(values), dtype=np.uint64)
+    for j in range(codepoints.shape[1]):
+        h = h * np.uint64(1000003) ^ codepoints[:, j]
+    return h
+
+
+def _duplicate_mask(cols: InvoiceColumns) -> "np.ndarray":
+    """
+    Rows whose validator.duplicate_key() string occurs more than once.
+
+    Rows are first grouped by a vectorized hash of the key fields; only
+    rows whose hash collides are compared on the exact key string, so the
+    result is exact while Python only ever sees candidate duplicates.
+    """
+    n = len(cols)
+    if n < 2:
+        return np.zeros(n, dtype=bool)
+
+    h = _string_hash(cols.invoice_number)
+    h = h * np.uint64(0x9E3779B97F4A7C15) ^ _string_hash(cols.seller_name)
+    h = h * np.uint64(0x9E3779B97F4A7C15) ^ cols.invoice_date.view(np.int64).astype(np.uint64)
+
+    # sorting the hashes alone (no argsort) finds the repeated values;
+    # there are few of them, so marking their rows with isin() is cheap
+    ordered = np.sort(h)
+    collides = np.isin(h, ordered[1:][ordered[1:] == ordered[:-1]])
+
+    candidates = np.flatnonzero(collides)
+    dates = np.datetime_as_string(cols.invoice_date[candidates], unit="D")
+    key_counts = Counter(
+        f"{num}::{seller}::{d}"
+        for num, seller, d in zip(cols.invoice_number[candidates], cols.seller_name[candidates], dates)
+    )
+    duplicate = np.zeros(n, dtype=bool)
+    for idx, num, seller, d in zip(
+        candidates, cols.invoice_number[candidates], cols.seller_name[candidates], dates
+    ):
+        duplicate[idx] = key_counts[f"{num}::{seller}::{d}"] > 1
+    return duplicate
+
+
+def validate_columns(
+    cols: InvoiceColumns, include_results: bool = True, rules: Optional[RuleSet] = None
+) -> Dict[str, Any]:
+    """
+    Vectorized equivalent of validate_invoices(): every rule is evaluated
+    as a boolean mask over the whole batch, and Python-level work is only
+    done for failing invoices. Returns the same {"summary", "results"}
+    structure with identical per-invoice errors.
+
+    Only the built-in rules have a vectorized form; a `rules` set (default:
+    the deployment's) with any other rule enabled raises ValueError.
+
+    Building one InvoiceResult per invoice is most of the remaining cost;
+    pass include_results=False when only the summary is needed ("results"
+    is then an empty list).
+    """
+    _require_numpy()
+    n = len(cols)
+    if rules is None:
+        rules = default_rules()
+
+    # rule name -> (mask, message); a None message means "invalid_currency: <value>"
+    vectorized: dict[str, tuple[Callable[[], "np.ndarray"], str | None]] = {
+        "missing_invoice_number": (lambda: _blank(cols.invoice_number), "missing_field: invoice_number"),
+        "missing_seller_name": (lambda: _blank(cols.seller_name), "missing_field: seller_name"),
+        "missing_buyer_name": (lambda: _blank(cols.buyer_name), "missing_field: buyer_name"),
+        "invalid_currency": (lambda: ~np.isin(cols.currency, sorted(ALLOWED_CURRENCIES)), None),
+        "invoice_date_too_old": (
+            lambda: cols.invoice_date < np.datetime64("2000-01-01"),
+            "invalid_date: invoice_date_too_old",
+        ),
+        # NaT compares False, so invoices without a due date never fail
+        "due_date_before_invoice_date": (
+            lambda: cols.due_date < cols.invoice_date,
+            "business_rule_failed: due_date_before_invoice_date",
+        ),
+        "totals_mismatch": (
+            lambda: np.abs((cols.net_total + cols.tax_amount) - cols.gross_total) > EPSILON,
+            "business_rule_failed: totals_mismatch_net_plus_tax_ne_gross",
+        ),
+        "negative_totals": (
+            lambda: (cols.net_total < 0) | (cols.tax_amount < 0) | (cols.gross_total < 0),
+            "anomaly: negative_totals",
+        ),
+        "line_items_sum_mismatch": (
+            lambda: cols.has_line_items & (np.abs(cols.line_items_sum - cols.net_total) > EPSILON),
+            "business_rule_failed: line_items_sum_ne_net_total",
+        ),
+    }
+    unsupported = [name for name in rules.names if name not in vectorized]
+    if unsupported:
+        raise ValueError(f"rules without a columnar version: {', '.join(unsupported)} (use the object engine)")
+
+    # (mask, message) in the order validate_invoices() reports them
+    checks: list[tuple["np.ndarray", str | None]] = [
+        (vectorized[name][0](), vectorized[name][1]) for name in rules.names
+    ]
+    duplicate = _duplicate_mask(cols)
+
+    invalid = np.zeros(n, dtype=bool)
+    for mask, _ in checks:
+        invalid |= mask
+
+    errors: dict[int, list[str]] = {}
+    # (first row, rule position) per message, to reproduce the Counter
+    # insertion order of validate_invoices(); duplicates always come last
+    first_seen: dict[str, tuple[int, int]] = {}
+    error_counter: Counter[str] = Counter()
+    for order, (mask, message) in enumerate(checks + [(duplicate, DUPLICATE_INVOICE)]):
+        rows = np.flatnonzero(mask)
+        if not len(rows):
+            continue
+        if message is None:
+            messages = [invalid_currency_message(c) for c in cols.currency[rows].tolist()]
+        else:
+            messages = [message] * len(rows)
+            error_counter[message] += len(rows)
+            first_seen[message] = (n if mask is duplicate else int(rows[0]), order)
+        for idx, msg in zip(rows.tolist(), messages):
+            if message is None:
+                error_counter[msg] += 1
+                first_seen.setdefault(msg, (idx, order))
+            if include_results:
+                errors.setdefault(idx, []).append(msg)
+
+    ordered_counts = Counter({msg: error_counter[msg] for msg in sorted(first_seen, key=first_seen.__getitem__)})
+
+    results: list[InvoiceResult] = []
+    if include_results:
+        with _gc_paused():
+            results = [
+                InvoiceResult(num, src, not bad, tuple(errors[idx]) if idx in errors else ())
+                for idx, (num, src, bad) in enumerate(
+                    zip(cols.invoice_number.tolist(), cols.source_file.tolist(), invalid.tolist())
+                )
+            ]
+
+    return {
+        "summary": _build_summary(n, int(invalid.sum()), ordered_counts),
+        "results": results,
+    }
+
+
+def validate_invoices_columnar(invoices: List[Invoice]) -> Dict[str, Any]:
+    """validate_invoices() via the columnar engine."""
+    return validate_columns(InvoiceColumns.from_invoices(invoices))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+
+# SQLite caps the number of bound parameters per statement
+_LOOKUP_BATCH = 500
+
+
+def key_digest(key: str) -> int:
+    """
+    Signed 64-bit digest of a duplicate key: a compact stand-in for the
+    key string that fits a SQLite INTEGER.
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+class DuplicateIndex:
+    """
+    Persistent index of duplicate-key digests from previous runs, stored in
+    SQLite with the digest as INTEGER PRIMARY KEY (the table's own rowid
+    B-tree). Opening it loads nothing; a lookup is a single index probe,
+    so it stays fast with tens of millions of historical keys.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS invoice_keys ("
+            " digest INTEGER PRIMARY KEY,"
+            " source_file TEXT NOT NULL"
+            ")"
+        )
+        self._conn.commit()
+
+    def __enter__(self) -> DuplicateIndex:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM invoice_keys").fetchone()[0]
+
+    def __contains__(self, digest: int) -> bool:
+        row = self._conn.execute("SELECT 1 FROM invoice_keys WHERE digest = ?", (digest,)).fetchone()
+        return row is not None
+
+    def contains_many(self, digests: Iterable[int]) -> set[int]:
+        """Return the subset of `digests` already in the index."""
+        digests = list(dict.fromkeys(digests))
+        found: set[int] = set()
+        for start in range(0, len(digests), _LOOKUP_BATCH):
+            batch = digests[start:start + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT digest FROM invoice_keys WHERE digest IN ({placeholders})", batch
+            )
+            found.update(digest for (digest,) in rows)
+        return found
+
+    def sources_many(self, digests: Iterable[int]) -> dict[int, str]:
+        """Map each of `digests` already in the index to the source_file it was recorded with."""
+        digests = list(dict.fromkeys(digests))
+        sources: dict[int, str] = {}
+        for start in range(0, len(digests), _LOOKUP_BATCH):
+            batch = digests[start:start + _LOOKUP_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT digest, source_file FROM invoice_keys WHERE digest IN ({placeholders})", batch
+            )
+            sources.update(rows)
+        return sources
+
+    def add_many(self, entries: Iterable[tuple[int, str]]) -> None:
+        """
+        Record (digest, source_file) pairs in one transaction. Digests that
+        are already present keep their original source_file.
+        """
+        # inserting in key order keeps B-tree page writes sequential
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO invoice_keys (digest, source_file) VALUES (?, ?)", sorted(entries)
+            )
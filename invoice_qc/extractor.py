@@ -1,74 +1,302 @@
 from __future__ import annotations
+import logging
+import os
 import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from typing import List
-
-import pdfplumber
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
 
+from .cache import ExtractionCache, content_key
 from .schema import Invoice, LineItem
-from .utils import parse_date_maybe, parse_amount_maybe
+from .text_backends import DEFAULT_TEXT_BACKEND, get_text_backend
+from .timing import FileTimings, stage
+from .utils import NumberFormat, infer_dayfirst, infer_number_format, parse_date_maybe
+
+if TYPE_CHECKING:
+    # sharding imports the validator, which extraction workers never need
+    from .sharding import Shard
 
 
-# Some basic label patterns - you can expand these after seeing actual PDFs
+# Some basic label patterns - you can expand these after seeing actual PDFs.
+# Each pattern captures the field in a group named "value".
 INVOICE_NO_PATTERNS = [
-    r"Invoice\s*(No\.?|Number|#)\s*[:\-]\s*(\S+)",
-    r"Inv\s*#\s*[:\-]\s*(\S+)",
+    r"Invoice\s*(?:No\.?|Number|#)\s*[:\-]\s*(?P<value>\S+)",
+    r"Inv\s*#\s*[:\-]\s*(?P<value>\S+)",
 ]
 
 INVOICE_DATE_PATTERNS = [
-    r"Invoice\s*Date\s*[:\-]\s*([A-Za-z0-9/\-\. ]+)",
-    r"Date\s*[:\-]\s*([A-Za-z0-9/\-\. ]+)",
+    r"Invoice\s*Date\s*[:\-]\s*(?P<value>[A-Za-z0-9/\-\. ]+)",
+    r"Date\s*[:\-]\s*(?P<value>[A-Za-z0-9/\-\. ]+)",
 ]
 
 DUE_DATE_PATTERNS = [
-    r"Due\s*Date\s*[:\-]\s*([A-Za-z0-9/\-\. ]+)",
+    r"Due\s*Date\s*[:\-]\s*(?P<value>[A-Za-z0-9/\-\. ]+)",
 ]
 
 SELLER_PATTERNS = [
-    r"Seller\s*[:\-]\s*(.+)",
-    r"Supplier\s*[:\-]\s*(.+)",
+    r"Seller\s*[:\-]\s*(?P<value>.+)",
+    r"Supplier\s*[:\-]\s*(?P<value>.+)",
 ]
 
 BUYER_PATTERNS = [
-    r"Buyer\s*[:\-]\s*(.+)",
-    r"Customer\s*[:\-]\s*(.+)",
+    r"Buyer\s*[:\-]\s*(?P<value>.+)",
+    r"Customer\s*[:\-]\s*(?P<value>.+)",
+]
+
+# naive detection of GST/VAT-like IDs; the first one found is the seller's
+TAX_ID_PATTERNS = [
+    r"(?:GSTIN|VAT|Tax\s*ID)\s*[:\-]\s*(?P<value>[A-Za-z0-9\-]+)",
 ]
 
+PAYMENT_TERMS_PATTERNS = [
+    r"Payment\s*Terms\s*[:\-]\s*(?P<value>.+)",
+]
+
+# Header field -> label patterns in priority order: an earlier pattern wins
+# over a later one, and within one pattern the first occurrence wins.
+HEADER_FIELD_PATTERNS: dict[str, list[str]] = {
+    "invoice_number": INVOICE_NO_PATTERNS,
+    "invoice_date": INVOICE_DATE_PATTERNS,
+    "due_date": DUE_DATE_PATTERNS,
+    "seller_name": SELLER_PATTERNS,
+    "buyer_name": BUYER_PATTERNS,
+    "seller_tax_id": TAX_ID_PATTERNS,
+    "payment_terms": PAYMENT_TERMS_PATTERNS,
+}
+
 CURRENCY_CODES = ["INR", "EUR", "USD", "GBP"]
 
+# Bump whenever the extraction heuristics change; it is part of the cache key
+# and of the incremental-run manifest.
+EXTRACTOR_VERSION = "2"
 
-def _extract_text_from_pdf(path: Path) -> str:
-    """Extract all text from a PDF using pdfplumber."""
+logger = logging.getLogger(__name__)
+
+
+def _extract_text_from_pdf(
+    path: Path, timings: Optional[FileTimings] = None, text_backend: str = DEFAULT_TEXT_BACKEND
+) -> str:
+    """Extract all text from a PDF with the given text backend (see text_backends)."""
     text_parts: list[str] = []
-    with pdfplumber.open(path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text() or ""
-            text_parts.append(page_text)
+    with get_text_backend(text_backend)(path, timings) as pages:
+        for page_text in pages:
+            with stage(timings, "extract_text"):
+                text_parts.append(page_text())
     return "\n".join(text_parts)
 
 
-def _search_first(patterns: list[str], text: str, group: int = 1) -> str | None:
-    for pat in patterns:
-        m = re.search(pat, text, flags=re.IGNORECASE)
-        if m:
-            return m.group(group).strip()
-    return None
+@dataclass(frozen=True)
+class PageSelection:
+    """
+    Read only the first `head` and last `tail` pages of a PDF: header
+    fields sit on page 1 and totals on the last page, so long annexes can
+    be skipped. If any required field is missing from those pages, the
+    remaining pages are extracted and the whole document is parsed.
+    """
+    head: int = 1
+    tail: int = 1
+
+    @classmethod
+    def parse(cls, spec: str) -> Optional[PageSelection]:
+        """Parse "all" (None: every page) or "N:M" (first N and last M pages)."""
+        if spec == "all":
+            return None
+        head, sep, tail = spec.partition(":")
+        if not sep or not head.isdigit() or not tail.isdigit() or int(head) + int(tail) == 0:
+            raise ValueError(f"invalid page selection {spec!r} (expected 'all' or 'N:M')")
+        return cls(int(head), int(tail))
+
+    def __str__(self) -> str:
+        return f"{self.head}:{self.tail}"
+
+
+# fields that fall back to placeholders when not found
+REQUIRED_FIELDS = ("invoice_number", "invoice_date", "seller_name", "buyer_name")
+
+
+def _has_required_fields(text: str) -> bool:
+    fields = _scan_header_fields(text)
+    if any(not fields.get(name) for name in REQUIRED_FIELDS):
+        return False
+    if parse_date_maybe(fields["invoice_date"]) is None:
+        return False
+    _, _, gross = _extract_totals(text)
+    return gross != 0.0
+
+
+def _extract_selected_text(
+    path: Path,
+    selection: PageSelection,
+    timings: Optional[FileTimings] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> str:
+    """
+    Text of the head and tail pages if they hold every required field,
+    otherwise of the full document (head/tail pages are not re-extracted).
+    """
+    with get_text_backend(text_backend)(path, timings) as pages:
+        n = len(pages)
+        texts: dict[int, str] = {}
+
+        def page_text(idx: int) -> str:
+            if idx not in texts:
+                with stage(timings, "extract_text"):
+                    texts[idx] = pages[idx]()
+            return texts[idx]
+
+        selected = sorted(set(range(min(selection.head, n))) | set(range(max(n - selection.tail, 0), n)))
+        text = "\n".join(page_text(idx) for idx in selected)
+        if len(selected) == n:
+            return text
+        with stage(timings, "parse_fields"):
+            complete = _has_required_fields(text)
+        if complete:
+            return text
+        return "\n".join(page_text(idx) for idx in range(n))
+
+
+def _label_keywords(pattern: str) -> list[str]:
+    """
+    Lower-cased literal word(s) every match of `pattern` starts with,
+    e.g. "invoice" or ["gstin", "vat", "tax"] for a leading (?:A|B|C) group.
+    """
+    if pattern.startswith("(?:"):
+        alternatives = pattern[3:pattern.index(")")].split("|")
+    else:
+        alternatives = [pattern]
+    return [re.match(r"[A-Za-z]+", alt).group().lower() for alt in alternatives]
+
+
+def _compile_header_scanner(
+    field_patterns: dict[str, list[str]],
+) -> tuple[re.Pattern[str], dict[str, list[tuple[str, int, re.Pattern[str], int]]]]:
+    """
+    Build the single-pass header scanner.
+
+    Returns one compiled regex matching any lower-case label keyword
+    (longest first, so "invoice" is preferred over "inv"), plus a dispatch
+    table from a matched keyword to the (field, priority, anchored
+    pattern, offset) candidates to try at the match start + offset.
+
+    The keyword scan does not overlap matches, so a label starting inside
+    a matched keyword ("vat" in "INVAT:", after "inv") is never hit on its
+    own; its candidates are tried from the enclosing keyword instead, at
+    the offset where it would start, in position order.
+
+    The keyword regex is case-sensitive and meant to run over lower-cased
+    text: re.IGNORECASE alternations are an order of magnitude slower.
+    """
+    by_keyword: dict[str, list[tuple[str, int, re.Pattern[str]]]] = {}
+    for field, patterns in field_patterns.items():
+        for prio, pat in enumerate(patterns):
+            compiled = re.compile(pat, re.IGNORECASE)
+            for kw in _label_keywords(pat):
+                by_keyword.setdefault(kw, []).append((field, prio, compiled))
+
+    keywords = sorted(by_keyword, key=len, reverse=True)
+    scanner = re.compile("|".join(re.escape(kw) for kw in keywords))
+
+    dispatch: dict[str, list[tuple[str, int, re.Pattern[str], int]]] = {}
+    for hit in keywords:
+        candidates: list[tuple[str, int, re.Pattern[str], int]] = []
+        for offset in range(len(hit)):
+            rest = hit[offset:]
+            # at offset 0 a hit on "invoice" must also try the patterns
+            # registered under "inv"; further in, any keyword that could
+            # start there, even if it runs past the end of the hit
+            starting = [kw for kw in keywords if rest.startswith(kw) or (offset and kw.startswith(rest))]
+            for field, prio, pattern in (cand for kw in starting for cand in by_keyword[kw]):
+                if (field, prio, pattern, offset) not in candidates:
+                    candidates.append((field, prio, pattern, offset))
+        dispatch[hit] = candidates
+    return scanner, dispatch
+
+
+_HEADER_SCANNER, _HEADER_DISPATCH = _compile_header_scanner(HEADER_FIELD_PATTERNS)
+_KEYWORD_OVERLAP = max(len(kw) for kw in _HEADER_DISPATCH) - 1
+
+# lower-case the text in windows of this size, so a scan that can stop on
+# page 1 does not pay for lower-casing a 200-page annex. The first window
+# is smaller: when every label sits in the first lines, lower-casing 8 KB
+# would cost more than the rest of the scan.
+_FIRST_SCAN_WINDOW = 1024
+_SCAN_WINDOW = 8192
+
+_CURRENCY_RE = re.compile(r"\b(" + "|".join(CURRENCY_CODES) + r")\b")
+
+
+def _lower_ascii_aligned(chunk: str) -> str:
+    lowered = chunk.lower()
+    if len(lowered) != len(chunk):
+        # a few non-ASCII characters change length when lower-cased;
+        # lower only ASCII so positions stay aligned with the original
+        lowered = "".join(ch.lower() if ch.isascii() else ch for ch in chunk)
+    return lowered
+
+
+def _scan_header_fields(text: str) -> dict[str, str]:
+    """
+    Walk the text once and return {field: value} for every header field
+    found, with the same precedence as trying each field's patterns in
+    order with re.search. Stops early once every field has a match from
+    its top-priority pattern.
+    """
+    best: dict[str, tuple[int, str]] = {}
+    pending = len(HEADER_FIELD_PATTERNS)
+
+    start, size = 0, _FIRST_SCAN_WINDOW
+    while start < len(text) and pending:
+        end = start + size
+        # overlap so a keyword straddling the window edge is still seen;
+        # hits starting in the overlap belong to the next window
+        window = _lower_ascii_aligned(text[start:end + _KEYWORD_OVERLAP])
+        for hit in _HEADER_SCANNER.finditer(window):
+            at = hit.start()
+            if at >= size:
+                break
+            at += start
+            for field, prio, pattern, offset in _HEADER_DISPATCH[hit.group()]:
+                found = best.get(field)
+                if found is not None and found[0] <= prio:
+                    continue
+                m = pattern.match(text, at + offset)
+                if m:
+                    best[field] = (prio, m.group("value").strip())
+                    if prio == 0:
+                        pending -= 1
+            if not pending:
+                break
+        start, size = end, _SCAN_WINDOW
+
+    return {field: value for field, (_, value) in best.items()}
 
 
 def _guess_currency(text: str) -> str:
-    for code in CURRENCY_CODES:
-        if re.search(rf"\b{code}\b", text):
-            return code
+    # earlier codes in CURRENCY_CODES win, wherever they appear
+    best = len(CURRENCY_CODES)
+    for m in _CURRENCY_RE.finditer(text):
+        best = min(best, CURRENCY_CODES.index(m.group(1)))
+        if best == 0:
+            break
+    if best < len(CURRENCY_CODES):
+        return CURRENCY_CODES[best]
     # very naive fallback: INR
     return "INR"
 
 
-def _extract_totals(text: str) -> tuple[float, float, float]:
+def _extract_totals(text: str, number_format: Optional[NumberFormat] = None) -> tuple[float, float, float]:
     """
     Very simple heuristic:
     - look for lines containing 'Net', 'Tax', 'Total'
     - parse last number on those lines
+
+    Amounts are read in `number_format` (inferred from `text` if None).
     """
+    if number_format is None:
+        number_format = infer_number_format(text)
     net = 0.0
     tax = 0.0
     gross = 0.0
@@ -76,15 +304,15 @@ def _extract_totals(text: str) -> tuple[float, float, float]:
     for line in text.splitlines():
         lower = line.lower()
         if "net" in lower and "total" in lower or "subtotal" in lower:
-            amt = parse_amount_maybe(line)
+            amt = number_format.last_amount(line)
             if amt is not None:
                 net = amt
         elif "tax" in lower or "vat" in lower or "gst" in lower:
-            amt = parse_amount_maybe(line)
+            amt = number_format.last_amount(line)
             if amt is not None:
                 tax = amt
         elif ("total" in lower or "grand total" in lower) and "net" not in lower:
-            amt = parse_amount_maybe(line)
+            amt = number_format.last_amount(line)
             if amt is not None:
                 gross = amt
 
@@ -95,7 +323,7 @@ def _extract_totals(text: str) -> tuple[float, float, float]:
     return net, tax, gross
 
 
-def _extract_line_items(text: str) -> list[LineItem]:
+def _extract_line_items(text: str, number_format: NumberFormat) -> list[LineItem]:
     """
     For starter version, we keep this VERY simple:
     - If you don't have time to parse tables, return empty list.
@@ -104,46 +332,52 @@ def _extract_line_items(text: str) -> list[LineItem]:
     return []  # keeping line items optional for now
 
 
-def parse_invoice_from_text(text: str, source_file: str) -> Invoice:
+def parse_invoice_from_text(text: str, source_file: str, timings: Optional[FileTimings] = None) -> Invoice:
     """
     Convert raw text into an Invoice object using simple regex-based heuristics.
     Missing fields will raise validation error if required.
     """
+    with stage(timings, "parse_fields"):
+        fields = _parse_fields(text)
+    with stage(timings, "build_invoice"):
+        return Invoice(source_file=source_file, **fields)
+
+
+def _parse_fields(text: str) -> dict[str, Any]:
+    """Invoice field values found in `text`, with placeholders for missing required ones."""
+    fields = _scan_header_fields(text)
+
     # invoice number
-    invoice_number = _search_first(INVOICE_NO_PATTERNS, text) or "UNKNOWN"
+    invoice_number = fields.get("invoice_number") or "UNKNOWN"
 
-    # invoice date
-    raw_inv_date = _search_first(INVOICE_DATE_PATTERNS, text) or ""
-    invoice_date = parse_date_maybe(raw_inv_date) or parse_date_maybe("2000-01-01")
+    # dates; 03/04/2024-style dates follow the document's convention
+    raw_inv_date = fields.get("invoice_date") or ""
+    raw_due_date = fields.get("due_date") or ""
+    dayfirst = infer_dayfirst(text)
+    invoice_date = parse_date_maybe(raw_inv_date, dayfirst) or date(2000, 1, 1)
 
     # due date (optional)
-    raw_due_date = _search_first(DUE_DATE_PATTERNS, text) or ""
-    due_date = parse_date_maybe(raw_due_date)
+    due_date = parse_date_maybe(raw_due_date, dayfirst)
 
     # parties
-    seller_name = _search_first(SELLER_PATTERNS, text) or "UNKNOWN_SELLER"
-    buyer_name = _search_first(BUYER_PATTERNS, text) or "UNKNOWN_BUYER"
+    seller_name = fields.get("seller_name") or "UNKNOWN_SELLER"
+    buyer_name = fields.get("buyer_name") or "UNKNOWN_BUYER"
 
-    # tax IDs - for now, naive detection of GST/VAT-like pattern
-    seller_tax_id = None
+    # tax IDs - only the seller's is detected for now
+    seller_tax_id = fields.get("seller_tax_id")
     buyer_tax_id = None
 
-    tax_id_match = re.search(r"(GSTIN|VAT|Tax\s*ID)\s*[:\-]\s*([A-Za-z0-9\-]+)", text, re.IGNORECASE)
-    if tax_id_match:
-        seller_tax_id = tax_id_match.group(2).strip()
-
     # currency and totals
     currency = _guess_currency(text)
-    net_total, tax_amount, gross_total = _extract_totals(text)
+    number_format = infer_number_format(text)
+    net_total, tax_amount, gross_total = _extract_totals(text, number_format)
 
     # payment terms
-    payment_terms_match = re.search(r"Payment\s*Terms\s*[:\-]\s*(.+)", text, re.IGNORECASE)
-    payment_terms = payment_terms_match.group(1).strip() if payment_terms_match else None
+    payment_terms = fields.get("payment_terms")
 
-    line_items = _extract_line_items(text)
+    line_items = _extract_line_items(text, number_format)
 
-    return Invoice(
-        source_file=source_file,
+    return dict(
         invoice_number=invoice_number,
         invoice_date=invoice_date,
         due_date=due_date,
@@ -160,16 +394,215 @@ def parse_invoice_from_text(text: str, source_file: str) -> Invoice:
     )
 
 
-def extract_from_dir(pdf_dir: str | Path) -> List[Invoice]:
+def _extract_one(
+    pdf_path: Path,
+    pages: Optional[PageSelection] = None,
+    timings: Optional[FileTimings] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> Invoice | None:
     """
-    Scan a folder, read all PDFs, and return a list of Invoice objects.
+    Extract a single PDF. Runs inside worker processes, so it must stay
+    a module-level function (picklable) and must never raise: a broken
+    PDF is logged and reported as None instead of killing the batch.
+    """
+    try:
+        if pages is None:
+            text = _extract_text_from_pdf(pdf_path, timings, text_backend)
+        else:
+            text = _extract_selected_text(pdf_path, pages, timings, text_backend)
+        return parse_invoice_from_text(text, source_file=pdf_path.name, timings=timings)
+    except Exception as exc:
+        logger.warning("Skipping %s: %s", pdf_path.name, exc)
+        return None
+
+
+def _extract_one_timed(
+    pdf_path: Path, pages: Optional[PageSelection] = None, text_backend: str = DEFAULT_TEXT_BACKEND
+) -> tuple[Invoice | None, FileTimings]:
+    """_extract_one() that also returns its per-stage timings (for worker processes)."""
+    timings = FileTimings(pdf_path.name)
+    return _extract_one(pdf_path, pages, timings, text_backend), timings
+
+
+def _resolve_workers(workers: int) -> int:
+    """0 (or negative) means one worker per CPU."""
+    if workers <= 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def extraction_version(pages: Optional[PageSelection] = None, text_backend: str = DEFAULT_TEXT_BACKEND) -> str:
+    """
+    What an extraction result depends on besides the PDF bytes: the
+    extractor version and, since they can change what is extracted, the
+    page selection and a non-default text backend.
+    """
+    version = EXTRACTOR_VERSION if pages is None else f"{EXTRACTOR_VERSION}:pages={pages}"
+    return version if text_backend == DEFAULT_TEXT_BACKEND else f"{version}:text={text_backend}"
+
+
+def _iter_extracted(
+    pdf_paths: list[Path],
+    cache: Optional[ExtractionCache],
+    pool: Optional[ProcessPoolExecutor],
+    window: int,
+    pages: Optional[PageSelection] = None,
+    timings: Optional[List[FileTimings]] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> Iterator[Invoice]:
+    """
+    Yield invoices for `pdf_paths` in order. Cache hits are served
+    directly; misses are parsed inline, or submitted to `pool` with at
+    most `window` PDFs in flight, so memory stays bounded however large
+    the folder is. If `timings` is a list, one FileTimings per PDF is
+    appended to it as the PDF is settled.
     """
-    pdf_dir = Path(pdf_dir)
-    invoices: list[Invoice] = []
+    # (cache key, Invoice | Future | None, freshly parsed?, timings so far)
+    inflight: deque[tuple[str | None, Any, bool, Optional[FileTimings]]] = deque()
+    parsed_any = False
+    cache_version = extraction_version(pages, text_backend)
+
+    def settle(key: str | None, job: Any, fresh: bool, file_timings: Optional[FileTimings]) -> Invoice | None:
+        inv = job.result() if isinstance(job, Future) else job
+        if file_timings is not None:
+            if fresh:
+                inv, worker_timings = inv
+                file_timings.merge(worker_timings)
+            timings.append(file_timings)
+        if fresh and cache is not None and inv is not None:
+            cache.put(key, inv)
+        return inv
+
+    for pdf_path in pdf_paths:
+        key = None
+        cached = None
+        file_timings = FileTimings(pdf_path.name) if timings is not None else None
+        if cache is not None:
+            with stage(file_timings, "cache"):
+                try:
+                    key = content_key(pdf_path.read_bytes(), cache_version)
+                except OSError as exc:
+                    logger.warning("Skipping %s: %s", pdf_path.name, exc)
+                    continue
+                cached = cache.get(key)
+
+        if cached is not None:
+            # same content may live under another name; report this one
+            inv = cached.model_copy(update={"source_file": pdf_path.name})
+            inflight.append((key, inv, False, file_timings))
+        else:
+            extract = _extract_one if timings is None else _extract_one_timed
+            if pool is not None:
+                job = pool.submit(extract, pdf_path, pages, text_backend=text_backend)
+            else:
+                job = extract(pdf_path, pages, text_backend=text_backend)
+            inflight.append((key, job, True, file_timings))
+            parsed_any = True
+
+        while len(inflight) > window:
+            inv = settle(*inflight.popleft())
+            if inv is not None:
+                yield inv
+
+    while inflight:
+        inv = settle(*inflight.popleft())
+        if inv is not None:
+            yield inv
+
+    if cache is not None and parsed_any:
+        cache.prune()
+
+
+def iter_extract_from_dir(
+    pdf_dir: str | Path,
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None,
+    pages: Optional[PageSelection] = None,
+    timings: Optional[List[FileTimings]] = None,
+    shard: Optional[Shard] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> Iterator[Invoice]:
+    """
+    Scan a folder and yield Invoice objects as they are parsed.
+
+    PDFs are processed in sorted file-name order and invoices are yielded
+    in that order regardless of `workers`. With workers > 1 the text
+    extraction and parsing are fanned out over a process pool. PDFs that
+    cannot be read are skipped (and logged).
+
+    If `cache` is given, PDFs whose content was extracted before (same
+    bytes, same EXTRACTOR_VERSION) are served from it and only the rest
+    are parsed.
+
+    `pages` limits text extraction to the first/last pages of each PDF,
+    falling back to the full document when required fields are missing
+    (see PageSelection). None reads every page.
 
-    for pdf_path in pdf_dir.glob("*.pdf"):
-        text = _extract_text_from_pdf(pdf_path)
-        inv = parse_invoice_from_text(text, source_file=pdf_path.name)
-        invoices.append(inv)
+    If `timings` is a list, a FileTimings with the per-stage wall and CPU
+    time of each PDF is appended to it (for timing.summarize_timings()).
 
-    return invoices
+    With `shard`, only the PDFs whose name falls into that shard are read
+    (see sharding.Shard).
+
+    `text_backend` names the PDF text extraction backend (see
+    text_backends): "pdfplumber", or the faster "pdfminer".
+    """
+    pdf_paths = sorted(Path(pdf_dir).glob("*.pdf"))
+    if shard is not None:
+        pdf_paths = [path for path in pdf_paths if shard.contains(path.name)]
+    yield from iter_extract_paths(
+        pdf_paths, workers=workers, cache=cache, pages=pages, timings=timings, text_backend=text_backend
+    )
+
+
+def iter_extract_paths(
+    pdf_paths: List[Path],
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None,
+    pages: Optional[PageSelection] = None,
+    timings: Optional[List[FileTimings]] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> Iterator[Invoice]:
+    """iter_extract_from_dir() over the given PDFs, in the given order."""
+    # an unknown name fails here, not once per PDF in the workers
+    get_text_backend(text_backend)
+    workers = min(_resolve_workers(workers), max(len(pdf_paths), 1))
+
+    if workers > 1:
+        # the pool only spawns processes on first submit, so a fully
+        # cached run never starts any; keep a few PDFs queued per worker
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            yield from _iter_extracted(
+                pdf_paths, cache, pool, window=workers * 4, pages=pages, timings=timings, text_backend=text_backend
+            )
+    else:
+        yield from _iter_extracted(
+            pdf_paths, cache, None, window=0, pages=pages, timings=timings, text_backend=text_backend
+        )
+
+
+def extract_from_dir(
+    pdf_dir: str | Path,
+    workers: int = 1,
+    cache: Optional[ExtractionCache] = None,
+    pages: Optional[PageSelection] = None,
+    timings: Optional[List[FileTimings]] = None,
+    shard: Optional[Shard] = None,
+    text_backend: str = DEFAULT_TEXT_BACKEND,
+) -> List[Invoice]:
+    """
+    Scan a folder, read all PDFs, and return a list of Invoice objects.
+    See iter_extract_from_dir() for ordering, workers, cache, pages,
+    timings, shard and text_backend.
+    """
+    return list(
+        iter_extract_from_dir(
+            pdf_dir,
+            workers=workers,
+            cache=cache,
+            pages=pages,
+            timings=timings,
+            shard=shard,
+            text_backend=text_backend,
+        )
+    )
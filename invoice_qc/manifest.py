@@ -0,0 +1,156 @@
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .schema import Invoice
+from .serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# bump when the manifest layout changes; older manifests are then ignored
+MANIFEST_FORMAT = 1
+
+
+def manifest_path(report_path: Path) -> Path:
+    """The manifest lives beside the report: <report>.manifest.jsonl."""
+    return report_path.with_name(report_path.name + ".manifest.jsonl")
+
+
+# read size when hashing PDFs (hashlib.file_digest needs Python 3.11)
+_HASH_CHUNK = 1024 * 1024
+
+
+def _file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as fh:
+        while chunk := fh.read(_HASH_CHUNK):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+@dataclass
+class ManifestEntry:
+    size: int
+    mtime_ns: int
+    sha256: str
+    # None: the PDF could not be extracted (it is retried once it changes)
+    invoice: Optional[Invoice]
+
+
+class RunManifest:
+    """
+    Per-PDF record of an incremental full-run: size, mtime and SHA-256 of
+    each file with the invoice extracted from it, so a re-run only
+    extracts new or changed PDFs.
+
+    Stored as JSONL: a header line with the format and extraction version
+    (see extractor.extraction_version()), then one line per PDF. A
+    manifest written by another extractor version or page selection is
+    discarded as a whole.
+    """
+
+    def __init__(self, extraction_version: str):
+        self.extraction_version = extraction_version
+        self.entries: Dict[str, ManifestEntry] = {}
+        # file name -> (size, mtime_ns, sha256) of PDFs found changed by diff()
+        self._pending: Dict[str, Tuple[int, int, str]] = {}
+
+    @classmethod
+    def load(cls, path: Path, extraction_version: str) -> RunManifest:
+        """The manifest at `path`, or an empty one if it is missing, unreadable or outdated."""
+        manifest = cls(extraction_version)
+        try:
+            with path.open("r", encoding="utf-8") as fh:
+                header = json.loads(fh.readline() or "{}")
+                if header.get("format") != MANIFEST_FORMAT or header.get("extraction_version") != extraction_version:
+                    logger.info("Ignoring manifest %s written by another extractor version", path)
+                    return manifest
+                for line in fh:
+                    record = json.loads(line)
+                    invoice = record["invoice"]
+                    manifest.entries[record["name"]] = ManifestEntry(
+                        record["size"],
+                        record["mtime_ns"],
+                        record["sha256"],
+                        Invoice.model_validate(invoice) if invoice is not None else None,
+                    )
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as exc:
+            logger.warning("Ignoring unreadable manifest %s: %s", path, exc)
+            manifest.entries.clear()
+        return manifest
+
+    def diff(self, pdf_paths: List[Path]) -> Tuple[List[Path], List[str]]:
+        """
+        Compare the manifest with the PDFs now present. Returns the PDFs to
+        extract (new, or content changed) and the names of PDFs that are
+        gone, whose entries are dropped. Files with the recorded size and
+        mtime are trusted unread; others are hashed, so a file that was
+        only touched or copied over unchanged is not extracted again.
+        """
+        present = {path.name for path in pdf_paths}
+        removed = [name for name in self.entries if name not in present]
+        for name in removed:
+            del self.entries[name]
+        return self.changed(pdf_paths), removed
+
+    def changed(self, pdf_paths: List[Path]) -> List[Path]:
+        """
+        The PDFs among `pdf_paths` to extract, like diff(), without
+        dropping the entries of PDFs that are not listed.
+        """
+        to_extract: List[Path] = []
+        for path in pdf_paths:
+            try:
+                st = path.stat()
+            except OSError as exc:
+                logger.warning("Skipping %s: %s", path.name, exc)
+                continue
+            entry = self.entries.get(path.name)
+            if entry is not None and (entry.size, entry.mtime_ns) == (st.st_size, st.st_mtime_ns):
+                continue
+            try:
+                sha256 = _file_sha256(path)
+            except OSError as exc:
+                logger.warning("Skipping %s: %s", path.name, exc)
+                continue
+            if entry is not None and entry.sha256 == sha256:
+                entry.size, entry.mtime_ns = st.st_size, st.st_mtime_ns
+                continue
+            self._pending[path.name] = (st.st_size, st.st_mtime_ns, sha256)
+            to_extract.append(path)
+        return to_extract
+
+    def record(self, name: str, invoice: Optional[Invoice]) -> None:
+        """Store the extraction result of a PDF returned by diff() or changed()."""
+        size, mtime_ns, sha256 = self._pending.pop(name)
+        self.entries[name] = ManifestEntry(size, mtime_ns, sha256, invoice)
+
+    def invoices(self) -> List[Invoice]:
+        """The extracted invoices, in file-name order (as iter_extract_from_dir() yields them)."""
+        return [self.entries[name].invoice for name in sorted(self.entries) if self.entries[name].invoice is not None]
+
+    def save(self, path: Path) -> None:
+        """Write the manifest, atomically replacing the previous one."""
+        tmp = path.with_name(path.name + ".tmp")
+        with tmp.open("wb") as fh:
+            fh.write(dumps({"format": MANIFEST_FORMAT, "extraction_version": self.extraction_version}, compact=True))
+            fh.write(b"\n")
+            for name in sorted(self.entries):
+                entry = self.entries[name]
+                record = {
+                    "name": name,
+                    "size": entry.size,
+                    "mtime_ns": entry.mtime_ns,
+                    "sha256": entry.sha256,
+                    "invoice": entry.invoice.model_dump(mode="json") if entry.invoice is not None else None,
+                }
+                fh.write(dumps(record, compact=True))
+                fh.write(b"\n")
+        os.replace(tmp, path)
@@ -0,0 +1,321 @@
+from __future__ import annotations
+import importlib
+import math
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .schema import Invoice
+
+
+EPSILON = 0.05  # tolerance for float comparisons
+ALLOWED_CURRENCIES = {"INR", "EUR", "USD", "GBP"}
+
+# cost classes, cheapest first: "field" rules compare a few scalar fields,
+# "scan" rules walk the line items. A compiled pass runs them in this order.
+COST_CLASSES = ("field", "scan")
+
+# invoices a fail-fast pass times each rule over to order them by cost
+CALIBRATION_SAMPLE = 64
+# fail-fast ordering buckets measured costs by powers of this factor above
+# the cheapest rule: rules of similar cost keep their declared order, so
+# timer noise cannot reorder them (and change which error is reported)
+COST_BUCKET_RATIO = 4.0
+
+# per-deployment configuration, comma-separated rule or module names
+RULE_MODULES_ENV = "INVOICE_QC_RULE_MODULES"  # imported first, to register extra rules
+ENABLE_RULES_ENV = "INVOICE_QC_ENABLE_RULES"  # turn on rules registered as disabled
+DISABLE_RULES_ENV = "INVOICE_QC_DISABLE_RULES"
+
+# a check returns its error message, or None if the invoice passes
+RuleCheck = Callable[[Invoice], Optional[str]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    check: RuleCheck
+    fields: Tuple[str, ...]
+    cost: str = "field"
+    enabled: bool = True
+
+
+class RuleRegistry:
+    """
+    Named validation rules. Each declares the Invoice fields it reads and
+    its cost class; compile() turns the enabled ones into a RuleSet.
+    """
+
+    def __init__(self) -> None:
+        self._rules: Dict[str, Rule] = {}
+
+    def register(
+        self, name: str, fields: Iterable[str], cost: str = "field", enabled: bool = True
+    ) -> Callable[[RuleCheck], RuleCheck]:
+        """
+        Decorator registering `check` as rule `name`. Rules registered with
+        enabled=False (e.g. tenant-specific ones) only run when enabled
+        explicitly.
+        """
+
+        def decorator(check: RuleCheck) -> RuleCheck:
+            self.add(Rule(name, check, tuple(fields), cost, enabled))
+            return check
+
+        return decorator
+
+    def add(self, rule: Rule) -> None:
+        if rule.name in self._rules:
+            raise ValueError(f"rule {rule.name!r} is already registered")
+        if rule.cost not in COST_CLASSES:
+            raise ValueError(f"rule {rule.name!r}: unknown cost class {rule.cost!r} (expected one of {COST_CLASSES})")
+        unknown = [f for f in rule.fields if f not in Invoice.model_fields]
+        if unknown:
+            raise ValueError(f"rule {rule.name!r} reads unknown invoice fields: {', '.join(unknown)}")
+        self._rules[rule.name] = rule
+
+    def rules(self) -> List[Rule]:
+        return list(self._rules.values())
+
+    def compile(self, enable: Iterable[str] = (), disable: Iterable[str] = (), timed: bool = False) -> RuleSet:
+        """
+        RuleSet of the rules enabled by default plus `enable`, minus
+        `disable`, ordered by cost class and then registration order.
+        Unknown names raise ValueError, so a typo in a deployment's
+        configuration fails at startup instead of silently skipping a rule.
+        """
+        enable, disable = set(enable), set(disable)
+        unknown = sorted((enable | disable) - self._rules.keys())
+        if unknown:
+            raise ValueError(f"unknown rules: {', '.join(unknown)}")
+        selected = [
+            rule
+            for rule in self._rules.values()
+            if (rule.enabled or rule.name in enable) and rule.name not in disable
+        ]
+        # sorted() is stable, so registration order holds within a cost class
+        selected = sorted(selected, key=lambda rule: COST_CLASSES.index(rule.cost))
+        return RuleSet(selected, timed=timed)
+
+
+def _compile_pass(
+    checks: Tuple[RuleCheck, ...], first_error_only: bool = False
+) -> Callable[[Invoice], Tuple[str, ...]]:
+    """
+    Build one function that calls every check in order, unrolled: no
+    per-rule loop iteration, and the checks are bound as fast locals.
+    With `first_error_only` it returns at the first failing check.
+    Only indices go into the generated source, never rule names.
+    """
+    params = "".join(f", _check{i}=_check{i}" for i in range(len(checks)))
+    on_error = "return (message,)" if first_error_only else "errors.append(message)"
+    body = "".join(
+        f"    message = _check{i}(invoice)\n    if message is not None:\n        {on_error}\n"
+        for i in range(len(checks))
+    )
+    head, result = ("", "()") if first_error_only else ("    errors = []\n", "tuple(errors)")
+    source = f"def check_all(invoice{params}):\n{head}{body}    return {result}\n"
+    namespace: Dict[str, object] = {f"_check{i}": check for i, check in enumerate(checks)}
+    exec(compile(source, "<invoice_qc.rules>", "exec"), namespace)
+    return namespace["check_all"]  # type: ignore[return-value]
+
+
+class RuleSet:
+    """
+    A compiled, ordered set of rules: check() runs them all over one
+    invoice in a single generated pass and returns the error messages in
+    rule order. Each enabled rule costs one function call per invoice.
+
+    With timed=True, calls, failures and seconds are counted per rule
+    (see counters()); this costs two clock reads per rule, so the default
+    pass does not do it. With first_error_only=True (see fail_fast()),
+    check() stops at the first error and returns at most one message.
+    """
+
+    def __init__(self, rules: Iterable[Rule], timed: bool = False, first_error_only: bool = False):
+        self.rules: Tuple[Rule, ...] = tuple(rules)
+        self.first_error_only = first_error_only
+        self.names: Tuple[str, ...] = tuple(rule.name for rule in self.rules)
+        self.fields = frozenset(f for rule in self.rules for f in rule.fields)
+        self._checks = tuple(rule.check for rule in self.rules)
+        self._check_all = _compile_pass(self._checks, first_error_only)
+        # rule name -> [calls, failures, seconds]
+        self._counters: Optional[Dict[str, list]] = (
+            {name: [0, 0, 0.0] for name in self.names} if timed else None
+        )
+        self._calibrated: Optional[RuleSet] = None
+
+    def check(self, invoice: Invoice) -> Tuple[str, ...]:
+        if self._counters is not None:
+            return self._check_timed(invoice)
+        return self._check_all(invoice)
+
+    def _check_timed(self, invoice: Invoice) -> Tuple[str, ...]:
+        errors: list[str] = []
+        for name, check in zip(self.names, self._checks):
+            start = time.perf_counter()
+            message = check(invoice)
+            spent = time.perf_counter() - start
+            counter = self._counters[name]
+            counter[0] += 1
+            counter[2] += spent
+            if message is not None:
+                counter[1] += 1
+                errors.append(message)
+                if self.first_error_only:
+                    break
+        return tuple(errors)
+
+    def measure(self, sample: Sequence[Invoice], rounds: int = 3) -> Dict[str, float]:
+        """Seconds per call of each rule over `sample` (best of `rounds`)."""
+        costs: Dict[str, float] = {}
+        for rule in self.rules:
+            check = rule.check
+            best = float("inf")
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for invoice in sample:
+                    check(invoice)
+                best = min(best, time.perf_counter() - start)
+            costs[rule.name] = best / len(sample)
+        return costs
+
+    def fail_fast(self, sample: Sequence[Invoice] = ()) -> RuleSet:
+        """
+        Copy of this set whose check() stops at the first error, cheapest
+        rule first: ordered by the per-call time measured over `sample`
+        (see CALIBRATION_SAMPLE), or by declared cost class if it is empty.
+
+        Measured costs are bucketed (see COST_BUCKET_RATIO), ties keeping
+        this set's order (cost class, then registration), and the first
+        calibrated order is reused for the life of the set: the same
+        input always gets the same first errors within a process.
+        """
+        if not sample:
+            return RuleSet(self.rules, timed=self._counters is not None, first_error_only=True)
+        if self._calibrated is None:
+            costs = self.measure(sample)
+            cheapest = max(min(costs.values(), default=0.0), 1e-12)
+            position = {rule.name: idx for idx, rule in enumerate(self.rules)}
+
+            def order(rule: Rule) -> tuple[int, int]:
+                bucket = math.floor(math.log(max(costs[rule.name], cheapest) / cheapest, COST_BUCKET_RATIO))
+                return bucket, position[rule.name]
+
+            self._calibrated = RuleSet(
+                sorted(self.rules, key=order), timed=self._counters is not None, first_error_only=True
+            )
+        return self._calibrated
+
+    def counters(self) -> Dict[str, Dict[str, float]]:
+        """Per-rule calls, failures and total seconds (empty unless timed)."""
+        if self._counters is None:
+            return {}
+        return {
+            name: {"calls": calls, "failures": failures, "seconds": round(seconds, 6)}
+            for name, (calls, failures, seconds) in self._counters.items()
+        }
+
+
+registry = RuleRegistry()
+
+
+def _env_names(var: str) -> List[str]:
+    return [name.strip() for name in os.environ.get(var, "").split(",") if name.strip()]
+
+
+def load_rules(timed: bool = False) -> RuleSet:
+    """
+    Compile the registry as configured for this deployment: import the
+    modules in INVOICE_QC_RULE_MODULES (which register their rules on
+    `registry`), then apply INVOICE_QC_ENABLE_RULES and
+    INVOICE_QC_DISABLE_RULES.
+    """
+    for module in _env_names(RULE_MODULES_ENV):
+        importlib.import_module(module)
+    return registry.compile(enable=_env_names(ENABLE_RULES_ENV), disable=_env_names(DISABLE_RULES_ENV), timed=timed)
+
+
+@lru_cache(maxsize=None)
+def default_rules() -> RuleSet:
+    """The untimed RuleSet from load_rules(), compiled once per process."""
+    return load_rules()
+
+
+# ---- built-in rules, in the order their errors are reported ----
+
+
+def invalid_currency_message(currency: str) -> str:
+    # the one message built per invoice; interning makes repeats share it
+    return sys.intern(f"invalid_currency: {currency}")
+
+
+@registry.register("missing_invoice_number", fields=("invoice_number",))
+def _missing_invoice_number(invoice: Invoice) -> Optional[str]:
+    if not invoice.invoice_number.strip():
+        return "missing_field: invoice_number"
+    return None
+
+
+@registry.register("missing_seller_name", fields=("seller_name",))
+def _missing_seller_name(invoice: Invoice) -> Optional[str]:
+    if not invoice.seller_name.strip():
+        return "missing_field: seller_name"
+    return None
+
+
+@registry.register("missing_buyer_name", fields=("buyer_name",))
+def _missing_buyer_name(invoice: Invoice) -> Optional[str]:
+    if not invoice.buyer_name.strip():
+        return "missing_field: buyer_name"
+    return None
+
+
+@registry.register("invalid_currency", fields=("currency",))
+def _invalid_currency(invoice: Invoice) -> Optional[str]:
+    if invoice.currency not in ALLOWED_CURRENCIES:
+        return invalid_currency_message(invoice.currency)
+    return None
+
+
+@registry.register("invoice_date_too_old", fields=("invoice_date",))
+def _invoice_date_too_old(invoice: Invoice) -> Optional[str]:
+    # basic date sanity check
+    if invoice.invoice_date.year < 2000:
+        return "invalid_date: invoice_date_too_old"
+    return None
+
+
+@registry.register("due_date_before_invoice_date", fields=("due_date", "invoice_date"))
+def _due_date_before_invoice_date(invoice: Invoice) -> Optional[str]:
+    if invoice.due_date and invoice.due_date < invoice.invoice_date:
+        return "business_rule_failed: due_date_before_invoice_date"
+    return None
+
+
+@registry.register("totals_mismatch", fields=("net_total", "tax_amount", "gross_total"))
+def _totals_mismatch(invoice: Invoice) -> Optional[str]:
+    # gross ≈ net + tax
+    if abs((invoice.net_total + invoice.tax_amount) - invoice.gross_total) > EPSILON:
+        return "business_rule_failed: totals_mismatch_net_plus_tax_ne_gross"
+    return None
+
+
+@registry.register("negative_totals", fields=("net_total", "tax_amount", "gross_total"))
+def _negative_totals(invoice: Invoice) -> Optional[str]:
+    if invoice.net_total < 0 or invoice.tax_amount < 0 or invoice.gross_total < 0:
+        return "anomaly: negative_totals"
+    return None
+
+
+@registry.register("line_items_sum_mismatch", fields=("line_items", "net_total"), cost="scan")
+def _line_items_sum_mismatch(invoice: Invoice) -> Optional[str]:
+    # if line items exist, check their sum vs net_total
+    if invoice.line_items:
+        lines_sum = sum(li.line_total for li in invoice.line_items)
+        if abs(lines_sum - invoice.net_total) > EPSILON:
+            return "business_rule_failed: line_items_sum_ne_net_total"
+    return None
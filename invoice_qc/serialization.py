@@ -0,0 +1,49 @@
+from __future__ import annotations
+import json
+from functools import lru_cache
+from typing import Any, List
+
+from pydantic import TypeAdapter
+
+from .schema import Invoice
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder is the fallback
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    # results objects (e.g. InvoiceResult) provide their report shape
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, compact: bool = False) -> bytes:
+    """
+    Encode plain JSON data (reports, summaries, InvoiceResults) as UTF-8
+    bytes: indented by two spaces like json.dumps(obj, indent=2), or with
+    no whitespace at all if `compact`. Uses orjson when it is installed.
+    """
+    if orjson is not None:
+        # orjson's own encoding of slotted dataclasses is slower than to_dict()
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | (0 if compact else orjson.OPT_INDENT_2)
+        return orjson.dumps(obj, default=_default, option=option)
+    if compact:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _invoice_list_adapter() -> TypeAdapter[List[Invoice]]:
+    return TypeAdapter(List[Invoice])
+
+
+def dump_invoices(invoices: List[Invoice], compact: bool = False) -> bytes:
+    """
+    Encode invoices as a JSON array straight from the models with
+    pydantic-core, skipping the model_dump() dicts in between.
+    """
+    return _invoice_list_adapter().dump_json(invoices, indent=None if compact else 2)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+import hashlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping
+
+from .duplicate_index import key_digest
+from .schema import Invoice
+from .validator import DUPLICATE_INVOICE, DUPLICATE_OF_PREVIOUS_RUN, InvoiceResult, _build_summary, duplicate_key
+
+
+@dataclass(frozen=True)
+class Shard:
+    """
+    One of `count` static partitions of a PDF folder, by a stable hash of
+    the file name: every machine computes the same split without
+    coordinating, and a file keeps its shard however the folder grows.
+    """
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1 or not 0 <= self.index < self.count:
+            raise ValueError(f"invalid shard {self.index}/{self.count} (need 0 <= index < count)")
+
+    def contains(self, file_name: str) -> bool:
+        # blake2b, not hash(): str hashes are salted per process
+        digest = hashlib.blake2b(file_name.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "big") % self.count == self.index
+
+
+def shard_section(shard: Shard, invoices: Iterable[Invoice]) -> Dict[str, Any]:
+    """
+    Report fields that let merge_reports() combine shard reports: the
+    shard, and per result (same order) the digest of its duplicate key.
+    """
+    return {
+        "shard": {"index": shard.index, "count": shard.count},
+        "duplicate_keys": [key_digest(duplicate_key(inv)) for inv in invoices],
+    }
+
+
+def merge_reports(reports: List[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine the reports of all shards of one run into the report an
+    unsharded run would have written: results in file-name order,
+    duplicates re-detected across shards from the stored key digests
+    (no invoices are needed), and the summary recomputed.
+
+    Raises ValueError if the reports are not exactly shards 0..count-1 of
+    the same sharding and validation mode.
+    """
+    if not reports:
+        raise ValueError("no reports to merge")
+    shards = [report.get("shard") for report in reports]
+    if any(shard is None or "duplicate_keys" not in report for shard, report in zip(shards, reports)):
+        raise ValueError("not a shard report (run full-run with --shard-index/--shard-count)")
+    counts = {shard["count"] for shard in shards}
+    if len(counts) != 1:
+        raise ValueError(f"reports come from different shard counts: {sorted(counts)}")
+    count = counts.pop()
+    indices = Counter(shard["index"] for shard in shards)
+    repeated = sorted(index for index, n in indices.items() if n > 1)
+    missing = sorted(set(range(count)) - indices.keys())
+    if repeated or missing:
+        raise ValueError(f"need each of shards 0..{count - 1} once (missing: {missing}, repeated: {repeated})")
+    modes = {report["summary"].get("mode", "full") for report in reports}
+    if len(modes) != 1:
+        raise ValueError(f"reports were validated in different modes: {sorted(modes)}")
+    mode = modes.pop()
+
+    entries: List[tuple[InvoiceResult, int]] = []
+    for report in reports:
+        for result, digest in zip(report["results"], report["duplicate_keys"]):
+            errors = tuple(e for e in result["errors"] if e != DUPLICATE_INVOICE)
+            entries.append(
+                (InvoiceResult(result["invoice_id"], result["source_file"], result["is_valid"], errors), digest)
+            )
+    # an unsharded run reports in file-name order
+    entries.sort(key=lambda entry: entry[0].source_file)
+    results = [result for result, _ in entries]
+
+    # error_counts in validate_invoices() order: rule errors, then duplicates
+    error_counter: Counter[str] = Counter(
+        e for result in results for e in result.errors if e != DUPLICATE_OF_PREVIOUS_RUN
+    )
+    if mode == "full":
+        digest_counts = Counter(digest for _, digest in entries)
+        for result, digest in entries:
+            if digest_counts[digest] > 1:
+                # in-batch duplicates come before cross-run ones
+                if result.errors and result.errors[-1] == DUPLICATE_OF_PREVIOUS_RUN:
+                    result.errors = result.errors[:-1] + (DUPLICATE_INVOICE, DUPLICATE_OF_PREVIOUS_RUN)
+                else:
+                    result.errors += (DUPLICATE_INVOICE,)
+                error_counter[DUPLICATE_INVOICE] += 1
+    previous_run = sum(1 for result in results if DUPLICATE_OF_PREVIOUS_RUN in result.errors)
+    if previous_run:
+        error_counter[DUPLICATE_OF_PREVIOUS_RUN] = previous_run
+
+    invalid_invoices = sum(1 for result in results if not result.is_valid)
+    return {
+        "summary": _build_summary(len(results), invalid_invoices, error_counter, mode),
+        "results": results,
+    }
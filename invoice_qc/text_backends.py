@@ -0,0 +1,241 @@
+from __future__ import annotations
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .timing import FileTimings, stage
+
+# A text backend opens a PDF and yields one zero-argument callable per
+# page returning that page's text, lines separated by "\n". Opening the
+# document and reading its page tree count as the "pdf_open" stage;
+# callers time the page callables as "extract_text". Page texts are only
+# computed when called, so a PageSelection can skip pages.
+PageTexts = Sequence[Callable[[], str]]
+TextBackend = Callable[[Path, Optional[FileTimings]], ContextManager[PageTexts]]
+
+DEFAULT_TEXT_BACKEND = "pdfplumber"
+
+_BACKENDS: Dict[str, TextBackend] = {}
+
+
+def text_backend(name: str) -> Callable[[TextBackend], TextBackend]:
+    """Decorator registering a text backend under `name`."""
+
+    def decorator(backend: TextBackend) -> TextBackend:
+        if name in _BACKENDS:
+            raise ValueError(f"text backend {name!r} is already registered")
+        _BACKENDS[name] = backend
+        return backend
+
+    return decorator
+
+
+def text_backend_names() -> List[str]:
+    return list(_BACKENDS)
+
+
+def get_text_backend(name: str) -> TextBackend:
+    try:
+        return _BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown text backend {name!r} (expected one of {', '.join(_BACKENDS)})") from None
+
+
+@text_backend("pdfplumber")
+@contextmanager
+def _pdfplumber_pages(path: Path, timings: Optional[FileTimings] = None) -> Iterator[PageTexts]:
+    # imported here: pdfplumber and pdfminer take longer to import than
+    # validating a small batch, and only extraction needs them
+    import pdfplumber
+
+    with stage(timings, "pdf_open"):
+        pdf = pdfplumber.open(path)
+    with pdf:
+        with stage(timings, "pdf_open"):
+            pages = pdf.pages
+        yield [lambda page=page: page.extract_text() or "" for page in pages]
+
+
+# ---- pdfminer: text without pdfplumber's per-character objects ----
+
+# pdfplumber's extract_text() defaults: characters whose tops are within
+# Y_TOLERANCE form a line, gaps wider than X_TOLERANCE separate words
+X_TOLERANCE = 3.0
+Y_TOLERANCE = 3.0
+
+# (-top, x0, x1, text) of one character, in device space
+_Char = Tuple[float, float, float, str]
+
+
+def _chars_to_text(chars: List[_Char]) -> str:
+    """
+    Join characters into text the way pdfplumber's extract_text() does
+    (without layout=True): lines by top, words split on whitespace and
+    on horizontal gaps, one space between words.
+    """
+    chars.sort(key=lambda ch: ch[0])
+    lines: List[str] = []
+    line: List[_Char] = []
+    last_top = 0.0
+    for ch in chars:
+        if line and ch[0] > last_top + Y_TOLERANCE:
+            lines.append(_line_text(line))
+            line = []
+        line.append(ch)
+        last_top = ch[0]
+    if line:
+        lines.append(_line_text(line))
+    return "\n".join(lines)
+
+
+def _line_text(line: List[_Char]) -> str:
+    line.sort(key=lambda ch: ch[1])
+    words: List[str] = []
+    word: List[str] = []
+    prev_x1 = 0.0
+    for _, x0, x1, text in line:
+        if text.isspace():
+            if word:
+                words.append("".join(word))
+                word = []
+            continue
+        if word and x0 > prev_x1 + X_TOLERANCE:
+            words.append("".join(word))
+            word = []
+        word.append(text)
+        prev_x1 = x1
+    if word:
+        words.append("".join(word))
+    return " ".join(words)
+
+
+# _char_collector() inlines PDFTextDevice.render_string_horizontal() of
+# this pdfminer.six release (pinned in requirements.txt); with any other
+# release it goes through pdfminer's own loop and render_char() instead
+PDFMINER_VERSION = "20260107"
+
+
+def _char_collector(rsrcmgr):
+    """
+    A pdfminer device that records the text and box of each character
+    and nothing else: no LTChar objects, no layout analysis.
+
+    Only upright horizontal text is grouped the way pdfplumber does; a
+    page with rotated, mirrored or vertical text (including a /Rotate
+    page) clears `upright` so the caller can hand it to pdfplumber.
+    """
+    import pdfminer
+    from pdfminer.pdfdevice import PDFTextDevice
+    from pdfminer.pdffont import PDFUnicodeNotDefined
+    from pdfminer.utils import mult_matrix
+
+    inline = pdfminer.__version__ == PDFMINER_VERSION
+
+    class CharCollector(PDFTextDevice):
+        def __init__(self, rsrcmgr) -> None:
+            super().__init__(rsrcmgr)
+            self.chars: List[_Char] = []
+            self.upright = True
+
+        def render_string(self, textstate, seq, ncs, graphicstate) -> None:
+            font = textstate.font
+            a, b, c, d, e, f = mult_matrix(textstate.matrix, self.ctm)
+            if font.is_vertical() or b or c or a <= 0 or d <= 0:
+                # characters would not run left to right along a line
+                self.upright = False
+                return
+            if not inline:
+                super().render_string(textstate, seq, ncs, graphicstate)
+                return
+            # PDFTextDevice.render_string_horizontal(), with the character
+            # box of LTChar computed inline
+            fontsize = textstate.fontsize
+            scaling = textstate.scaling * 0.01
+            charspace = textstate.charspace * scaling
+            wordspace = 0 if font.is_multibyte() else textstate.wordspace * scaling
+            dxscale = 0.001 * fontsize * scaling
+            bottom = font.get_descent() * fontsize + textstate.rise
+            top = bottom + fontsize
+            chars = self.chars
+            x, y = textstate.linematrix
+            needcharspace = False
+            for obj in seq:
+                if isinstance(obj, (int, float)):
+                    x -= obj * dxscale
+                    needcharspace = True
+                elif isinstance(obj, bytes):
+                    for cid in font.decode(obj):
+                        if needcharspace:
+                            x += charspace
+                        try:
+                            text = font.to_unichr(cid)
+                        except PDFUnicodeNotDefined:
+                            text = self.handle_undefined_char(font, cid)
+                        adv = font.char_width(cid) * fontsize * scaling
+                        ox = a * x + c * y + e
+                        oy = b * x + d * y + f
+                        x0, x1 = ox + c * bottom, ox + a * adv + c * top
+                        y0, y1 = oy + d * bottom, oy + b * adv + d * top
+                        chars.append((-max(y0, y1), min(x0, x1), max(x0, x1), text))
+                        x += adv
+                        if cid == 32 and wordspace:
+                            x += wordspace
+                        needcharspace = True
+            textstate.linematrix = (x, y)
+
+        def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate) -> float:
+            try:
+                text = font.to_unichr(cid)
+            except PDFUnicodeNotDefined:
+                text = self.handle_undefined_char(font, cid)
+            a, b, c, d, e, f = matrix
+            adv = font.char_width(cid) * fontsize * scaling
+            bottom = font.get_descent() * fontsize + rise
+            x0, x1 = e + c * bottom, e + a * adv + c * (bottom + fontsize)
+            y0, y1 = f + d * bottom, f + b * adv + d * (bottom + fontsize)
+            self.chars.append((-max(y0, y1), min(x0, x1), max(x0, x1), text))
+            return adv
+
+        def handle_undefined_char(self, font, cid: int) -> str:
+            # what pdfminer (and so pdfplumber) puts in their place
+            return f"(cid:{cid})"
+
+    return CharCollector(rsrcmgr)
+
+
+@text_backend("pdfminer")
+@contextmanager
+def _pdfminer_pages(path: Path, timings: Optional[FileTimings] = None) -> Iterator[PageTexts]:
+    """
+    Runs pdfminer's content-stream interpreter into a device that keeps
+    only each character's text and box, then groups them as pdfplumber
+    does. Same text as the pdfplumber backend for plain text-layer PDFs,
+    about 4x faster: pdfplumber builds an LTChar and then a dict of ~20
+    attributes per character before joining them. Pages with rotated or
+    vertical text are extracted by pdfplumber instead.
+    """
+    from pdfminer.pdfdocument import PDFDocument
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+    from pdfminer.pdfparser import PDFParser
+
+    with path.open("rb") as fh, ExitStack() as stack:
+        with stage(timings, "pdf_open"):
+            document = PDFDocument(PDFParser(fh))
+            pages = list(PDFPage.create_pages(document))
+        rsrcmgr = PDFResourceManager(caching=True)
+        device = _char_collector(rsrcmgr)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        fallback: List[PageTexts] = []
+
+        def page_text(index: int, page: PDFPage) -> str:
+            device.chars = []
+            device.upright = True
+            interpreter.process_page(page)
+            if device.upright:
+                return _chars_to_text(device.chars)
+            if not fallback:
+                fallback.append(stack.enter_context(_pdfplumber_pages(path)))
+            return fallback[0][index]()
+
+        yield [lambda index=index, page=page: page_text(index, page) for index, page in enumerate(pages)]
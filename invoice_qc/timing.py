@@ -0,0 +1,91 @@
+from __future__ import annotations
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional
+
+
+class FileTimings:
+    """
+    Wall-clock and CPU seconds spent per stage on one file, e.g.
+    "pdf_open", "extract_text", "parse_fields", "build_invoice",
+    "validate". Re-entering a stage adds to it (extract_text runs once per
+    page). Plain attributes only, so it pickles back from worker processes.
+    """
+
+    def __init__(self, source_file: str):
+        self.source_file = source_file
+        # stage -> [wall seconds, cpu seconds]
+        self.stages: dict[str, list[float]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            spent = self.stages.setdefault(name, [0.0, 0.0])
+            spent[0] += time.perf_counter() - wall
+            spent[1] += time.thread_time() - cpu
+
+    def merge(self, other: FileTimings) -> None:
+        for name, (wall, cpu) in other.stages.items():
+            spent = self.stages.setdefault(name, [0.0, 0.0])
+            spent[0] += wall
+            spent[1] += cpu
+
+    @property
+    def wall(self) -> float:
+        return sum(wall for wall, _ in self.stages.values())
+
+
+def stage(timings: Optional[FileTimings], name: str) -> ContextManager[None]:
+    """timings.stage(name), or a no-op when timing is off (timings is None)."""
+    return nullcontext() if timings is None else timings.stage(name)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(rank - 1, 0)]
+
+
+def summarize_timings(records: Iterable[FileTimings], slowest: int = 10) -> Dict[str, Any]:
+    """
+    Aggregate per-file timings for the report summary: p50/p95/max of
+    wall and CPU seconds per stage (over the files that went through that
+    stage) and the `slowest` files by total wall time.
+    """
+    records = list(records)
+    per_stage: dict[str, tuple[list[float], list[float]]] = {}
+    for rec in records:
+        for name, (wall, cpu) in rec.stages.items():
+            walls, cpus = per_stage.setdefault(name, ([], []))
+            walls.append(wall)
+            cpus.append(cpu)
+
+    stages: dict[str, dict[str, Any]] = {}
+    for name, (walls, cpus) in per_stage.items():
+        walls.sort()
+        cpus.sort()
+        stages[name] = {
+            "files": len(walls),
+            "wall_total": round(sum(walls), 6),
+            "wall_p50": round(_percentile(walls, 50), 6),
+            "wall_p95": round(_percentile(walls, 95), 6),
+            "wall_max": round(walls[-1], 6),
+            "cpu_p50": round(_percentile(cpus, 50), 6),
+            "cpu_p95": round(_percentile(cpus, 95), 6),
+            "cpu_max": round(cpus[-1], 6),
+        }
+
+    slowest_files: List[Dict[str, Any]] = [
+        {
+            "source_file": rec.source_file,
+            "wall": round(rec.wall, 6),
+            "stages": {name: round(wall, 6) for name, (wall, _) in rec.stages.items()},
+        }
+        for rec in sorted(records, key=lambda r: r.wall, reverse=True)[:slowest]
+    ]
+
+    return {"files": len(records), "stages": stages, "slowest_files": slowest_files}
@@ -1,26 +1,124 @@
 from __future__ import annotations
 import re
 from datetime import date
+from functools import lru_cache
 from typing import Optional
 
-from dateutil import parser as date_parser
 
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+MONTHS = {name: idx for idx, name in enumerate(_MONTH_NAMES, start=1)}
+MONTHS.update({name[:3]: idx for name, idx in list(MONTHS.items())})
+MONTHS["sept"] = 9
 
-def parse_date_maybe(value: str) -> Optional[date]:
+# fast-path formats, all full matches; anything else goes to dateutil.
+# Years are four digits without a leading zero: dateutil reads "0024"
+# and two-digit years relative to today, which is left to it.
+_YEAR = r"(?P<year>[1-9]\d{3})"
+_DAY = r"(?P<day>\d{1,2})"
+_MONTH_WORD = r"(?P<month>[A-Za-z]{3,9})"
+_ISO_DATE_RE = re.compile(_YEAR + r"(?P<sep>[-/.])(?P<month>\d{1,2})(?P=sep)(?P<day>\d{1,2})")
+_NUMERIC_DATE_RE = re.compile(r"(?P<first>\d{1,2})(?P<sep>[-/.])(?P<second>\d{1,2})(?P=sep)" + _YEAR)
+_MONTH_NAME_DATE_RES = [
+    # 10 Jan 2024, 10th January, 2024
+    re.compile(rf"{_DAY}(?:st|nd|rd|th)? +{_MONTH_WORD}\.?,? +{_YEAR}"),
+    # 10-Jan-2024, 10/Jan/2024
+    re.compile(rf"{_DAY}(?P<sep>[-/.]){_MONTH_WORD}(?P=sep){_YEAR}"),
+    # Jan 10, 2024, January 10th 2024
+    re.compile(rf"{_MONTH_WORD}\.? +{_DAY}(?:st|nd|rd|th)?,? +{_YEAR}"),
+    # Jan-10-2024
+    re.compile(rf"{_MONTH_WORD}(?P<sep>[-/.]){_DAY}(?P=sep){_YEAR}"),
+]
+
+# any d/m/y-looking token, used to infer a document's date convention
+_NUMERIC_DATE_SCAN_RE = re.compile(r"(?<!\d)(\d{1,2})([-/.])(\d{1,2})\2(?:\d{4}|\d{2})(?!\d)")
+
+# distinct (string, convention) pairs remembered by parse_date_maybe
+DATE_CACHE_SIZE = 4096
+
+
+def _resolve_day_month(first: int, second: int, dayfirst: bool) -> tuple[int, int]:
+    """(day, month) of "first/second/year"; like dateutil, a value > 12 can only be the day."""
+    if first > 12 and second <= 12:
+        return first, second
+    if second > 12 and first <= 12:
+        return second, first
+    return (first, second) if dayfirst else (second, first)
+
+
+def _parse_date_fast(value: str, dayfirst: bool) -> Optional[date]:
     """
-    Try to parse a date string. Return None if it fails.
-    Accepts many formats: 2024-01-10, 10/01/2024, etc.
+    Parse the common invoice date formats without dateutil. Returns None
+    when `value` is not one of them or is not a real date.
     """
-    value = value.strip()
-    if not value:
+    try:
+        m = _NUMERIC_DATE_RE.fullmatch(value)
+        if m:
+            day, month = _resolve_day_month(int(m["first"]), int(m["second"]), dayfirst)
+            return date(int(m["year"]), month, day)
+
+        # year first is always year-month-day
+        m = _ISO_DATE_RE.fullmatch(value)
+        if m:
+            return date(int(m["year"]), int(m["month"]), int(m["day"]))
+
+        for pattern in _MONTH_NAME_DATE_RES:
+            m = pattern.fullmatch(value)
+            if m:
+                month = MONTHS.get(m["month"].lower())
+                return date(int(m["year"]), month, int(m["day"])) if month is not None else None
+    except ValueError:  # e.g. 31/02/2024
         return None
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date_cached(value: str, dayfirst: bool) -> Optional[date]:
+    parsed = _parse_date_fast(value, dayfirst)
+    if parsed is not None:
+        return parsed
+    # dateutil is only the last resort, so it is only imported if needed
+    from dateutil import parser as date_parser
+
     try:
-        dt = date_parser.parse(value, dayfirst=True)
-        return dt.date()
+        return date_parser.parse(value, dayfirst=dayfirst).date()
     except Exception:
         return None
 
 
+def parse_date_maybe(value: str, dayfirst: bool = True) -> Optional[date]:
+    """
+    Try to parse a date string. Return None if it fails.
+    Accepts many formats: 2024-01-10, 10/01/2024, 10 Jan 2024, etc.
+
+    `dayfirst` decides ambiguous numeric dates such as 03/04/2024 (see
+    infer_dayfirst()); year-first dates are always year-month-day.
+    Common formats are parsed by precompiled regexes, anything else by
+    dateutil, and results are memoized (invoice batches repeat dates).
+    """
+    value = value.strip()
+    if not value:
+        return None
+    return _parse_date_cached(value, dayfirst)
+
+
+def infer_dayfirst(text: str, default: bool = True) -> bool:
+    """
+    Guess a document's numeric date convention: the first d/m/y-looking
+    date with a component above 12 decides it (13/01/2024 means
+    day-first, 01/13/2024 month-first). `default` if none is decisive.
+    """
+    for m in _NUMERIC_DATE_SCAN_RE.finditer(text):
+        first, second = int(m.group(1)), int(m.group(3))
+        if first > 12 and second <= 12:
+            return True
+        if second > 12 and first <= 12:
+            return False
+    return default
+
+
 def parse_amount_maybe(value: str) -> Optional[float]:
     """
     Clean and parse an amount like '₹ 1,234.50' or '1 234,50'.
@@ -46,3 +144,81 @@ def parse_amount_maybe(value: str) -> Optional[float]:
         return float(cleaned)
     except ValueError:
         return None
+
+
+# no-break / narrow no-break spaces also group thousands. A plain space
+# does not: on an invoice line it usually separates two numbers.
+_GROUP_SPACES = "\u00a0\u202f"
+
+
+class NumberFormat:
+    """
+    A document's amount convention: "." (1,234.50) or "," (1.234,50) as
+    the decimal mark, the other one grouping thousands. Indian grouping
+    (1,00,000.00) is accepted as well.
+
+    Tokenizes amounts with one compiled regex instead of stripping and
+    re-guessing every string; build it once per document with
+    infer_number_format().
+    """
+
+    def __init__(self, decimal: str):
+        if decimal not in (".", ","):
+            raise ValueError(f"decimal mark must be '.' or ',', not {decimal!r}")
+        self.decimal = decimal
+        self.thousands = "," if decimal == "." else "."
+        group = f"[{re.escape(self.thousands)}{_GROUP_SPACES}]"
+        # a plain space only groups thousands ("1 234,50"), never lakhs
+        group3 = f"[{re.escape(self.thousands)}{_GROUP_SPACES} ]"
+        # a whole number token: not glued to a word ("GSTIN 27AB...") except
+        # a currency code ("EUR1,234.50", "1,234.50USD"), not a percentage
+        # ("GST 18%"), and never the tail of a number whose start did not
+        # match ("234.50" in "1,234.50"). The other mark followed by one or
+        # two final digits cannot be grouping ("12,50" in a "." document):
+        # that token is read with the other convention, as
+        # parse_amount_maybe() would.
+        self._amount_re = re.compile(
+            rf"(?:(?<!\w)(?P<sign>-)?|(?<=\b[A-Z]{{3}}))(?<!\d[.,{_GROUP_SPACES}])"
+            rf"(?P<int>\d{{1,3}}(?:{group}\d{{2}})*(?:{group3}\d{{3}})+|\d+)"
+            rf"(?:{re.escape(decimal)}(?P<frac>\d+)|{re.escape(self.thousands)}(?P<other_frac>\d\d?)(?!\d|[.,]\d))?"
+            rf"(?:[A-Z]{{3}}\b)?(?![\w%])"
+        )
+        self._strip_groups = str.maketrans("", "", self.thousands + _GROUP_SPACES + " ")
+
+    def __repr__(self) -> str:
+        return f"NumberFormat(decimal={self.decimal!r})"
+
+    def last_amount(self, text: str) -> Optional[float]:
+        """The last amount in `text` (e.g. "GST 18%: 1,180.00" -> 1180.0), or None."""
+        tokens = self._amount_re.findall(text)
+        if not tokens:
+            return None
+        sign, integer, frac, other_frac = tokens[-1]
+        value = float(f"{integer.translate(self._strip_groups)}.{frac or other_frac or 0}")
+        return -value if sign else value
+
+
+POINT_DECIMAL = NumberFormat(".")
+COMMA_DECIMAL = NumberFormat(",")
+
+# a decimal mark followed by 1-2 digits that end the number; dates such as
+# 01.12.2025 are excluded by the lookahead
+_DECIMAL_MARK_RE = re.compile(r"[.,](?<=\d[.,])\d\d?(?!\d|[.,]\d)")
+
+# stop scanning once one convention leads by this many amounts
+_NUMBER_FORMAT_LEAD = 5
+
+
+def infer_number_format(text: str) -> NumberFormat:
+    """
+    Detect a document's amount convention from the separators that are
+    followed by exactly one or two final digits (the decimal mark in
+    "1,234.50", "1.234,50" or "99,5"). The first convention to lead by
+    _NUMBER_FORMAT_LEAD wins, else the majority, "." on a tie.
+    """
+    lead = 0  # commas minus points
+    for m in _DECIMAL_MARK_RE.finditer(text):
+        lead += 1 if m.group()[0] == "," else -1
+        if abs(lead) >= _NUMBER_FORMAT_LEAD:
+            break
+    return COMMA_DECIMAL if lead > 0 else POINT_DECIMAL
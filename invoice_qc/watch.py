@@ -0,0 +1,331 @@
+from __future__ import annotations
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import signal
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from .cache import ExtractionCache
+from .duplicate_index import DuplicateIndex
+from .extractor import PageSelection, _iter_extracted, _resolve_workers, extraction_version
+from .manifest import RunManifest, manifest_path
+from .rules import CALIBRATION_SAMPLE, RuleSet, default_rules
+from .serialization import dumps
+from .text_backends import DEFAULT_TEXT_BACKEND, get_text_backend
+from .validator import InvoiceResult, ValidationMode, validate_invoices
+
+logger = logging.getLogger(__name__)
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len; then the name
+
+# a batch is processed once no new PDF has arrived for this many seconds,
+# or when it has been collecting for MAX_BATCH_WAIT_SECONDS
+SETTLE_SECONDS = 1.0
+MAX_BATCH_WAIT_SECONDS = 10.0
+
+
+def _is_pdf(name: str) -> bool:
+    # same files as iter_extract_from_dir()'s "*.pdf" glob
+    return name.endswith(".pdf") and not name.startswith(".")
+
+
+class InotifyWatcher:
+    """
+    PDFs written (closed after writing) or moved into `folder`, from
+    Linux inotify through libc. Raises OSError where inotify is not
+    available; see open_watcher().
+    """
+
+    def __init__(self, folder: Path):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self._fd, os.fsencode(folder), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(errno, f"inotify_add_watch failed for {folder}")
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        """
+        Names of the PDFs that arrived within `timeout` seconds (empty if
+        none), or None if the kernel queue overflowed and events were
+        lost: the caller should rescan the folder.
+        """
+        deadline = time.monotonic() + timeout
+        names: Set[str] = set()
+        # events for other files (e.g. a temporary name before a rename)
+        # do not end the wait
+        while not names:
+            ready, _, _ = select.select([self._fd], [], [], max(deadline - time.monotonic(), 0.0))
+            if not ready:
+                break
+            if self._read_events(names) is None:
+                return None
+        return names
+
+    def _read_events(self, names: Set[str]) -> Optional[Set[str]]:
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return names
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    return None
+                if _is_pdf(name):
+                    names.add(name)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    """
+    Portable fallback for InotifyWatcher: lists `folder` every `interval`
+    seconds. A new or changed PDF is reported once its size and mtime
+    held still between two listings, so files still being copied in are
+    not picked up half-written.
+    """
+
+    def __init__(self, folder: Path, interval: float = 2.0):
+        self.folder = folder
+        self.interval = interval
+        self._reported = self._listing()
+        self._last = dict(self._reported)
+        self._next_poll = time.monotonic() + interval
+
+    def _listing(self) -> Dict[str, Tuple[int, int]]:
+        listing: Dict[str, Tuple[int, int]] = {}
+        try:
+            entries = list(os.scandir(self.folder))
+        except OSError as exc:
+            logger.warning("Cannot list %s: %s", self.folder, exc)
+            return listing
+        for entry in entries:
+            if _is_pdf(entry.name):
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                listing[entry.name] = (st.st_size, st.st_mtime_ns)
+        return listing
+
+    def wait(self, timeout: float) -> Optional[Set[str]]:
+        delay = self._next_poll - time.monotonic()
+        if delay > timeout:
+            time.sleep(timeout)
+            return set()
+        time.sleep(max(delay, 0.0))
+        self._next_poll = time.monotonic() + self.interval
+
+        listing = self._listing()
+        names = {
+            name
+            for name, state in listing.items()
+            if self._last.get(name) == state and self._reported.get(name) != state
+        }
+        for name in names:
+            self._reported[name] = listing[name]
+        self._last = listing
+        return names
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(folder: Path, poll_interval: float = 2.0, polling: bool = False) -> InotifyWatcher | PollingWatcher:
+    """InotifyWatcher where available (and `polling` is not forced), else PollingWatcher."""
+    if not polling:
+        try:
+            return InotifyWatcher(folder)
+        except (OSError, AttributeError) as exc:
+            # AttributeError: a libc without inotify_init1
+            logger.info("inotify unavailable (%s); polling %s every %ss", exc, folder, poll_interval)
+    return PollingWatcher(folder, poll_interval)
+
+
+class RollingReport:
+    """
+    Append-only JSONL report: one result per line with the time it was
+    validated. When the file grows past `max_bytes` it is renamed to
+    <name>.1 (older ones shifting to .2 ... .`backups`) and a new one begun.
+    """
+
+    def __init__(self, path: Path, max_bytes: Optional[int] = None, backups: int = 3):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def append(self, results: List[InvoiceResult]) -> None:
+        validated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        lines = b"".join(
+            dumps({"validated_at": validated_at, **result.to_dict()}, compact=True) + b"\n" for result in results
+        )
+        with self.path.open("ab") as fh:
+            fh.write(lines)
+            size = fh.tell()
+        if self.max_bytes is not None and size > self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        for idx in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{idx}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{idx + 1}"))
+        if self.backups > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+
+def _ignore_sigint() -> None:
+    # Ctrl-C reaches the whole process group; only the watch itself handles it
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class FolderWatch:
+    """
+    Extract and validate PDFs as they land in `pdf_dir`, appending the
+    results to `report`.
+
+    Arrivals are collected into batches (see SETTLE_SECONDS). A RunManifest
+    beside the report (<report>.manifest.jsonl) records the size, mtime and
+    SHA-256 of every PDF processed, so the initial scan of a restarted
+    watch and PDFs written again with the same content are skipped; a PDF
+    rewritten with new content is processed again.
+
+    The worker pool, the cache, the compiled rules (calibrated once, in
+    fail_fast mode) and the duplicate index live as long as the watch, so
+    workers keep their imported modules and nothing is re-initialised per
+    batch. Duplicates are
+    detected within a batch, and across batches and restarts through
+    `duplicate_index`, where a key recorded by the same file name does not
+    count. `on_batch` receives each batch's summary.
+    """
+
+    def __init__(
+        self,
+        pdf_dir: str | Path,
+        report: RollingReport,
+        workers: int = 1,
+        cache: Optional[ExtractionCache] = None,
+        pages: Optional[PageSelection] = None,
+        rules: Optional[RuleSet] = None,
+        mode: ValidationMode = "full",
+        duplicate_index: Optional[DuplicateIndex] = None,
+        on_batch: Optional[Callable[[Dict], None]] = None,
+        text_backend: str = DEFAULT_TEXT_BACKEND,
+    ):
+        self.pdf_dir = Path(pdf_dir)
+        self.report = report
+        self.workers = _resolve_workers(workers)
+        self.cache = cache
+        self.pages = pages
+        get_text_backend(text_backend)
+        self.text_backend = text_backend
+        self.rules = rules if rules is not None else default_rules()
+        self.mode = mode
+        self.duplicate_index = duplicate_index
+        self.on_batch = on_batch
+        # processes start on first submit and then stay up
+        self._pool = (
+            ProcessPoolExecutor(max_workers=self.workers, initializer=_ignore_sigint) if self.workers > 1 else None
+        )
+        self._manifest_path = manifest_path(report.path)
+        self.manifest = RunManifest.load(self._manifest_path, extraction_version(pages, text_backend))
+
+    def run(self, initial_scan: bool = True, poll_interval: float = 2.0, polling: bool = False) -> None:
+        """
+        Watch until interrupted (KeyboardInterrupt). With `initial_scan`,
+        PDFs already in the folder are processed first.
+        """
+        watcher = open_watcher(self.pdf_dir, poll_interval, polling)
+        try:
+            if initial_scan:
+                self.process(self._all_pdfs(), full_scan=True)
+            while True:
+                names = watcher.wait(timeout=60.0)
+                if names is not None and not names:
+                    continue
+                # keep collecting until arrivals pause
+                deadline = time.monotonic() + MAX_BATCH_WAIT_SECONDS
+                while names is not None and time.monotonic() < deadline:
+                    more = watcher.wait(timeout=SETTLE_SECONDS)
+                    if more is None:
+                        names = None
+                    elif not more:
+                        break
+                    else:
+                        names |= more
+                if names is None:
+                    logger.warning("Watch events were lost; rescanning %s", self.pdf_dir)
+                    self.process(self._all_pdfs(), full_scan=True)
+                else:
+                    self.process(names)
+        finally:
+            watcher.close()
+
+    def _all_pdfs(self) -> Set[str]:
+        return {path.name for path in self.pdf_dir.glob("*.pdf")}
+
+    def process(self, names: Set[str], full_scan: bool = False) -> Optional[Dict]:
+        """
+        Extract, validate and report the new or changed PDFs of one batch
+        of names; returns its summary (None if there was nothing to do).
+        With `full_scan`, `names` is the whole folder and the manifest
+        forgets PDFs that are gone.
+        """
+        # a file can be gone again by the time its batch runs
+        paths = [self.pdf_dir / name for name in sorted(names) if (self.pdf_dir / name).is_file()]
+        if full_scan:
+            paths, _ = self.manifest.diff(paths)
+        else:
+            paths = self.manifest.changed(paths)
+        window = self.workers * 4 if self._pool is not None else 0
+        extracted = {
+            inv.source_file: inv
+            for inv in _iter_extracted(
+                paths, self.cache, self._pool, window=window, pages=self.pages, text_backend=self.text_backend
+            )
+        }
+        for path in paths:
+            self.manifest.record(path.name, extracted.get(path.name))
+        if paths or full_scan:
+            self.manifest.save(self._manifest_path)
+        invoices = list(extracted.values())
+        if not invoices:
+            return None
+        if self.mode == "fail_fast" and not self.rules.first_error_only:
+            self.rules = self.rules.fail_fast(invoices[:CALIBRATION_SAMPLE])
+        result = validate_invoices(
+            invoices, duplicate_index=self.duplicate_index, rules=self.rules, mode=self.mode, ignore_own_records=True
+        )
+        self.report.append(result["results"])
+        if self.on_batch is not None:
+            self.on_batch(result["summary"])
+        return result["summary"]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
@@ -0,0 +1,87 @@
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from invoice_qc import extractor
+from invoice_qc.cache import ExtractionCache, content_key
+from invoice_qc.schema import Invoice
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from synthetic import make_invoice_pdf  # noqa: E402
+
+
+def _invoice(number: str) -> Invoice:
+    return Invoice(
+        source_file=f"{number}.pdf",
+        invoice_number=number,
+        invoice_date=date(2024, 1, 1),
+        seller_name="ABC Pvt Ltd",
+        buyer_name="XYZ Traders",
+        currency="INR",
+        net_total=100.0,
+        tax_amount=18.0,
+        gross_total=118.0,
+    )
+
+
+def test_hit_and_miss(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    key = content_key(b"%PDF-1.4 one", "2")
+    assert cache.get(key) is None
+    cache.put(key, _invoice("INV-1"))
+    assert cache.get(key) == _invoice("INV-1")
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.stats()["entries"] == 1
+
+
+def test_version_is_part_of_the_key(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    cache.put(content_key(b"%PDF-1.4 one", "2"), _invoice("INV-1"))
+    assert content_key(b"%PDF-1.4 one", "3") != content_key(b"%PDF-1.4 one", "2")
+    assert cache.get(content_key(b"%PDF-1.4 one", "3")) is None
+
+
+def test_corrupt_entry_is_a_miss_and_dropped(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    key = content_key(b"%PDF-1.4 one", "2")
+    cache.put(key, _invoice("INV-1"))
+    cache._path(key).write_text("{not json")
+    assert cache.get(key) is None
+    assert not cache._path(key).exists()
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    cache = ExtractionCache(tmp_path)
+    keys = [content_key(f"pdf {i}".encode(), "2") for i in range(3)]
+    for age, key in zip((300, 200, 100), keys):
+        cache.put(key, _invoice(key[:8]))
+        stamp = cache._path(key).stat().st_mtime - age
+        os.utime(cache._path(key), (stamp, stamp))
+    cache.get(keys[0])  # a hit makes the oldest entry the most recent
+
+    size = cache._path(keys[0]).stat().st_size
+    assert cache.prune(max_bytes=2 * size) == 1
+    assert [cache._path(key).exists() for key in keys] == [True, False, True]
+    assert cache.clear() == 2
+    assert cache.stats()["entries"] == 0
+
+
+def test_extraction_uses_cache_until_version_bump(tmp_path, monkeypatch):
+    pytest.importorskip("pdfplumber")
+    pdf_dir = tmp_path / "pdfs"
+    pdf_dir.mkdir()
+    for i in range(3):
+        (pdf_dir / f"invoice_{i}.pdf").write_bytes(make_invoice_pdf(i, lines_per_page=3))
+
+    cache = ExtractionCache(tmp_path / "cache")
+    first = extractor.extract_from_dir(pdf_dir, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 3)
+    assert extractor.extract_from_dir(pdf_dir, cache=cache) == first
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    monkeypatch.setattr(extractor, "EXTRACTOR_VERSION", extractor.EXTRACTOR_VERSION + ".test")
+    assert extractor.extract_from_dir(pdf_dir, cache=cache) == first
+    assert (cache.hits, cache.misses) == (3, 6)
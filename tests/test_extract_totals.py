@@ -0,0 +1,27 @@
+import pytest
+
+from invoice_qc.extractor import _extract_totals
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Net Total: 1,030.00\nGST 18%: 185.40\nGrand Total: 1,215.40", (1030.0, 185.4, 1215.4)),
+        ("Net Total: 1.030,00\nVAT 19%: 195,70\nGrand Total: 1.225,70", (1030.0, 195.7, 1225.7)),
+        ("Grand Total: 1,00,000.00", (0.0, 0.0, 100000.0)),
+        # a plain space groups thousands
+        ("Total: 1 234,50", (0.0, 0.0, 1234.5)),
+        # currency codes glued to the amount
+        ("Total EUR1,234.50", (0.0, 0.0, 1234.5)),
+        ("Total INR1,234.50", (0.0, 0.0, 1234.5)),
+        ("Total $1,234.50USD", (0.0, 0.0, 1234.5)),
+        # a token that contradicts the document's convention is read with
+        # the other one: "12,50" cannot be a thousands group
+        ("Net Total: 10.00\nGST 25%: 2.50\nGrand Total: 12,50", (10.0, 2.5, 12.5)),
+        ("Net Total: 1.000,00\nVAT 19%: 190,00\nGrand Total: 1190.00.", (1000.0, 190.0, 1190.0)),
+        # tax IDs are not amounts
+        ("GSTIN: 27ABCDE1234F1Z5\nGrand Total: 118.00", (0.0, 0.0, 118.0)),
+    ],
+)
+def test_extract_totals(text, expected):
+    assert _extract_totals(text) == expected
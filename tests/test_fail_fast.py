@@ -0,0 +1,86 @@
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from invoice_qc.cli import app
+from invoice_qc.duplicate_index import DuplicateIndex
+from invoice_qc.rules import RuleSet, default_rules
+from invoice_qc.serialization import dump_invoices
+from invoice_qc.validator import DUPLICATE_INVOICE, StreamingValidation, validate_invoices
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from synthetic import make_invoices  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def invoices():
+    # mismatched totals, bad currencies and duplicates
+    return make_invoices(1000)
+
+
+def test_first_error_only(invoices):
+    full = validate_invoices(invoices)
+    fast = validate_invoices(invoices, rules=default_rules().fail_fast(), mode="fail_fast")
+    assert any(len(r.errors) > 1 for r in full["results"])
+    for full_result, fast_result in zip(full["results"], fast["results"]):
+        rule_errors = tuple(e for e in full_result.errors if e != DUPLICATE_INVOICE)
+        # without a sample the rules keep their declared order
+        assert fast_result.errors == rule_errors[:1]
+        assert fast_result.is_valid == full_result.is_valid
+
+
+def test_summary_counts_first_errors(invoices):
+    summary = validate_invoices(invoices, mode="fail_fast")["summary"]
+    assert summary["mode"] == "fail_fast"
+    assert DUPLICATE_INVOICE not in summary["error_counts"]
+    assert sum(summary["error_counts"].values()) == summary["invalid_invoices"] > 0
+    assert validate_invoices(invoices)["summary"]["mode"] == "full"
+
+
+def test_streaming_matches_batch(invoices):
+    rules = default_rules().fail_fast(invoices[:64])
+    batch = validate_invoices(invoices, rules=rules, mode="fail_fast")
+    validation = StreamingValidation(rules=rules, mode="fail_fast")
+    assert list(validation.iter_results(invoices)) == batch["results"]
+    assert validation.summary() == batch["summary"]
+
+
+def test_calibrated_order_is_reused(invoices, monkeypatch):
+    rules = RuleSet(default_rules().rules)
+    first = rules.fail_fast(invoices[:64])
+    monkeypatch.setattr(RuleSet, "measure", lambda self, sample, rounds=3: pytest.fail("measured twice"))
+    assert rules.fail_fast(invoices[64:128]) is first
+
+
+def test_similar_costs_keep_declared_order(invoices, monkeypatch):
+    rules = RuleSet(default_rules().rules)
+    # timer noise within COST_BUCKET_RATIO must not reorder rules; only
+    # a rule several times dearer than the rest moves back
+    noisy = {name: 1e-7 * (1 + 0.5 * (i % 3)) for i, name in enumerate(rules.names)}
+    noisy["missing_invoice_number"] = 1e-5
+    monkeypatch.setattr(RuleSet, "measure", lambda self, sample, rounds=3: noisy)
+    order = rules.fail_fast(invoices[:64]).names
+    assert order == rules.names[1:] + ("missing_invoice_number",)
+
+
+def test_rejects_duplicate_index(invoices, tmp_path):
+    index = DuplicateIndex(tmp_path / "keys.sqlite")
+    try:
+        with pytest.raises(ValueError, match="duplicate index"):
+            validate_invoices(invoices, duplicate_index=index, mode="fail_fast")
+        with pytest.raises(ValueError, match="duplicate"):
+            StreamingValidation(set(), duplicate_index=index, mode="fail_fast")
+    finally:
+        index.close()
+
+
+def test_cli_rejects_dup_index(invoices, tmp_path):
+    path = tmp_path / "invoices.json"
+    path.write_bytes(dump_invoices(invoices[:10]))
+    args = ["validate", "--input", str(path), "--report", str(tmp_path / "report.json"), "--mode", "fail_fast"]
+    result = CliRunner().invoke(app, args + ["--dup-index", str(tmp_path / "keys.sqlite")])
+    assert result.exit_code == 1
+    assert "--dup-index is not supported" in result.output
+    assert not (tmp_path / "report.json").exists()
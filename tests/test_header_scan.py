@@ -0,0 +1,36 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from invoice_qc.extractor import _scan_header_fields
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from bench_header_scan import HEADER, legacy_scan, make_text  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        HEADER,
+        make_text(3),
+        "",
+        # labels starting inside another label's keyword: "vat" after
+        # "inv", "inv" after "gstin", "tax" after "payment"
+        "Ref: INVAT: X1\nVAT: DE999\nInvoice No: 7",
+        "GSTINV #: 55\nInv #: 66\nGSTIN: 27ABCDE1234F1Z5",
+        "PAYMENTAX ID: T1\nTax ID: T2\nPayment Terms: Net 30",
+        "Seller: ABC\nINVATAX: 5\nGSTIN: 27ABCDE1234F1Z5",
+        # a hidden label on either side of the first window's edge
+        "x" * 1019 + " INVAT: EDGE\nVAT: LATER",
+        "x" * 1021 + " INVAT: EDGE\nVAT: LATER",
+        "x" * 9000 + " INVAT: EDGE\nVAT: LATER",
+    ],
+    ids=lambda text: repr(text[-40:]),
+)
+def test_scanner_matches_per_pattern_search(text):
+    assert _scan_header_fields(text) == legacy_scan(text)[0]
+
+
+def test_overlapping_label_is_not_hidden():
+    assert _scan_header_fields("Ref: INVAT: X1\nVAT: DE999")["seller_tax_id"] == "X1"
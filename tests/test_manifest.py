@@ -0,0 +1,118 @@
+import os
+from datetime import date
+
+from invoice_qc import extractor
+from invoice_qc.manifest import RunManifest, manifest_path
+from invoice_qc.schema import Invoice
+
+
+def _invoice(name: str) -> Invoice:
+    return Invoice(
+        source_file=name,
+        invoice_number=f"INV-{name}",
+        invoice_date=date(2024, 1, 1),
+        seller_name="ABC Pvt Ltd",
+        buyer_name="XYZ Traders",
+        currency="INR",
+        net_total=100.0,
+        tax_amount=18.0,
+        gross_total=118.0,
+    )
+
+
+def _run(manifest: RunManifest, pdf_dir, path=None):
+    """One incremental run: extract what changed (here: a fake invoice per PDF)."""
+    to_extract, removed = manifest.diff(sorted(pdf_dir.glob("*.pdf")))
+    for pdf in to_extract:
+        manifest.record(pdf.name, _invoice(pdf.name) if pdf.read_bytes() != b"broken" else None)
+    if path is not None:
+        manifest.save(path)
+    return [pdf.name for pdf in to_extract], removed
+
+
+def _write(pdf_dir, files):
+    pdf_dir.mkdir(exist_ok=True)
+    for name, data in files.items():
+        (pdf_dir / name).write_bytes(data)
+
+
+def test_diff_new_changed_removed(tmp_path):
+    pdf_dir = tmp_path / "pdfs"
+    _write(pdf_dir, {"a.pdf": b"a", "b.pdf": b"b", "c.pdf": b"broken"})
+    manifest = RunManifest("2")
+    assert _run(manifest, pdf_dir) == (["a.pdf", "b.pdf", "c.pdf"], [])
+    assert [inv.source_file for inv in manifest.invoices()] == ["a.pdf", "b.pdf"]
+
+    assert _run(manifest, pdf_dir) == ([], [])
+
+    (pdf_dir / "b.pdf").write_bytes(b"b, edited")
+    (pdf_dir / "a.pdf").unlink()
+    _write(pdf_dir, {"d.pdf": b"d"})
+    assert _run(manifest, pdf_dir) == (["b.pdf", "d.pdf"], ["a.pdf"])
+    assert sorted(manifest.entries) == ["b.pdf", "c.pdf", "d.pdf"]
+
+
+def test_touched_or_rewritten_unchanged_is_not_extracted(tmp_path):
+    pdf_dir = tmp_path / "pdfs"
+    _write(pdf_dir, {"a.pdf": b"a"})
+    manifest = RunManifest("2")
+    _run(manifest, pdf_dir)
+
+    os.utime(pdf_dir / "a.pdf", ns=(0, 10**9))
+    assert _run(manifest, pdf_dir) == ([], [])
+    # the new mtime is recorded, so the next run does not hash it again
+    assert manifest.entries["a.pdf"].mtime_ns == 10**9
+
+
+def test_changed_keeps_unlisted_entries(tmp_path):
+    pdf_dir = tmp_path / "pdfs"
+    _write(pdf_dir, {"a.pdf": b"a", "b.pdf": b"b"})
+    manifest = RunManifest("2")
+    _run(manifest, pdf_dir)
+
+    (pdf_dir / "b.pdf").write_bytes(b"b, edited")
+    assert manifest.changed([pdf_dir / "b.pdf"]) == [pdf_dir / "b.pdf"]
+    assert sorted(manifest.entries) == ["a.pdf", "b.pdf"]
+
+
+def test_save_and_load(tmp_path):
+    pdf_dir = tmp_path / "pdfs"
+    path = manifest_path(tmp_path / "report.json")
+    assert path.name == "report.json.manifest.jsonl"
+    _write(pdf_dir, {"a.pdf": b"a", "c.pdf": b"broken"})
+    manifest = RunManifest("2")
+    _run(manifest, pdf_dir, path)
+
+    loaded = RunManifest.load(path, "2")
+    assert loaded.entries == manifest.entries
+    assert loaded.invoices() == [_invoice("a.pdf")]
+    assert _run(loaded, pdf_dir) == ([], [])
+
+
+def test_version_bump_invalidates_entries(tmp_path):
+    pdf_dir = tmp_path / "pdfs"
+    path = tmp_path / "report.json.manifest.jsonl"
+    _write(pdf_dir, {"a.pdf": b"a", "b.pdf": b"b"})
+    _run(RunManifest("2"), pdf_dir, path)
+
+    bumped = RunManifest.load(path, "3")
+    assert bumped.entries == {}
+    assert _run(bumped, pdf_dir, path) == (["a.pdf", "b.pdf"], [])
+    # the manifest now belongs to the new version
+    assert RunManifest.load(path, "2").entries == {}
+    assert len(RunManifest.load(path, "3").entries) == 2
+
+
+def test_unreadable_manifest_is_ignored(tmp_path):
+    path = tmp_path / "report.json.manifest.jsonl"
+    path.write_text('{"format": 1, "extraction_version": "2"}\n{"name": "a.pdf"}\n')
+    assert RunManifest.load(path, "2").entries == {}
+    assert RunManifest.load(tmp_path / "missing.jsonl", "2").entries == {}
+
+
+def test_extraction_version_covers_pages_and_backend(monkeypatch):
+    base = extractor.extraction_version()
+    assert extractor.extraction_version(extractor.PageSelection(1, 1)) != base
+    assert extractor.extraction_version(text_backend="pdfminer") != base
+    monkeypatch.setattr(extractor, "EXTRACTOR_VERSION", extractor.EXTRACTOR_VERSION + ".1")
+    assert extractor.extraction_version() != base
@@ -0,0 +1,165 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from invoice_qc import rules
+from invoice_qc.rules import (
+    ALLOWED_CURRENCIES,
+    DISABLE_RULES_ENV,
+    ENABLE_RULES_ENV,
+    EPSILON,
+    RULE_MODULES_ENV,
+    RuleRegistry,
+    load_rules,
+)
+from invoice_qc.schema import Invoice, LineItem
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from synthetic import make_invoices  # noqa: E402
+
+BUILTIN_RULES = (
+    "missing_invoice_number",
+    "missing_seller_name",
+    "missing_buyer_name",
+    "invalid_currency",
+    "invoice_date_too_old",
+    "due_date_before_invoice_date",
+    "totals_mismatch",
+    "negative_totals",
+    "line_items_sum_mismatch",
+)
+
+
+def _invoice(**changes) -> Invoice:
+    fields = dict(
+        source_file="a.pdf",
+        invoice_number="INV-1",
+        invoice_date=date(2024, 1, 10),
+        seller_name="ABC Pvt Ltd",
+        buyer_name="XYZ Traders",
+        currency="INR",
+        net_total=100.0,
+        tax_amount=18.0,
+        gross_total=118.0,
+    )
+    fields.update(changes)
+    return Invoice(**fields)
+
+
+def _legacy_errors(invoice: Invoice) -> tuple:
+    """The checks validate_invoices() ran before rules became a registry."""
+    errors = []
+    if not invoice.invoice_number.strip():
+        errors.append("missing_field: invoice_number")
+    if not invoice.seller_name.strip():
+        errors.append("missing_field: seller_name")
+    if not invoice.buyer_name.strip():
+        errors.append("missing_field: buyer_name")
+    if invoice.currency not in ALLOWED_CURRENCIES:
+        errors.append(f"invalid_currency: {invoice.currency}")
+    if invoice.invoice_date.year < 2000:
+        errors.append("invalid_date: invoice_date_too_old")
+    if invoice.due_date and invoice.due_date < invoice.invoice_date:
+        errors.append("business_rule_failed: due_date_before_invoice_date")
+    if abs((invoice.net_total + invoice.tax_amount) - invoice.gross_total) > EPSILON:
+        errors.append("business_rule_failed: totals_mismatch_net_plus_tax_ne_gross")
+    if invoice.net_total < 0 or invoice.tax_amount < 0 or invoice.gross_total < 0:
+        errors.append("anomaly: negative_totals")
+    if invoice.line_items:
+        if abs(sum(li.line_total for li in invoice.line_items) - invoice.net_total) > EPSILON:
+            errors.append("business_rule_failed: line_items_sum_ne_net_total")
+    return tuple(errors)
+
+
+EDGE_CASES = [
+    _invoice(),
+    _invoice(invoice_number=" ", seller_name="", buyer_name="\t"),
+    _invoice(currency="XXX", invoice_date=date(1999, 12, 31)),
+    _invoice(due_date=date(2024, 1, 1)),
+    _invoice(due_date=date(2024, 2, 1), gross_total=120.0),
+    _invoice(net_total=-100.0, tax_amount=-18.0, gross_total=-118.0),
+    _invoice(line_items=[LineItem(description="A", quantity=1, unit_price=60, line_total=60)]),
+    _invoice(line_items=[LineItem(description="A", quantity=2, unit_price=50, line_total=100)]),
+    _invoice(currency="", gross_total=0.0, net_total=-1.0, invoice_date=date(1990, 1, 1)),
+]
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A copy of the rule registry that load_rules() and rule modules see."""
+    copy = RuleRegistry()
+    for rule in rules.registry.rules():
+        copy.add(rule)
+    monkeypatch.setattr(rules, "registry", copy)
+    for var in (RULE_MODULES_ENV, ENABLE_RULES_ENV, DISABLE_RULES_ENV):
+        monkeypatch.delenv(var, raising=False)
+    return copy
+
+
+def test_builtin_rules_in_report_order(registry):
+    assert load_rules().names == BUILTIN_RULES
+
+
+@pytest.mark.parametrize("invoice", EDGE_CASES)
+def test_compiled_pass_matches_builtin_checks(registry, invoice):
+    expected = _legacy_errors(invoice)
+    assert load_rules().check(invoice) == expected
+    assert load_rules(timed=True).check(invoice) == expected
+
+
+def test_compiled_pass_matches_builtin_checks_on_synthetic_batch(registry):
+    ruleset = load_rules()
+    invoices = make_invoices(2000)
+    assert [ruleset.check(inv) for inv in invoices] == [_legacy_errors(inv) for inv in invoices]
+
+
+def test_disable_rules_from_env(registry, monkeypatch):
+    monkeypatch.setenv(DISABLE_RULES_ENV, "invalid_currency, negative_totals")
+    ruleset = load_rules()
+    assert "invalid_currency" not in ruleset.names and "negative_totals" not in ruleset.names
+    assert ruleset.check(_invoice(currency="XXX", net_total=-1.0, gross_total=17.0)) == ()
+
+
+def test_unknown_rule_name_fails(registry, monkeypatch):
+    monkeypatch.setenv(ENABLE_RULES_ENV, "no_such_rule")
+    with pytest.raises(ValueError, match="no_such_rule"):
+        load_rules()
+
+
+def test_rule_module_registers_disabled_rule(registry, monkeypatch, tmp_path):
+    module = "invoice_qc_test_tenant_rules"
+    (tmp_path / f"{module}.py").write_text(
+        "from invoice_qc.rules import registry\n"
+        "\n"
+        "@registry.register('po_number_required', fields=('payment_terms',), enabled=False)\n"
+        "def _po_number_required(invoice):\n"
+        "    if not invoice.payment_terms:\n"
+        "        return 'missing_field: payment_terms'\n"
+        "    return None\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv(RULE_MODULES_ENV, module)
+    try:
+        assert "po_number_required" not in load_rules().names
+
+        monkeypatch.setenv(ENABLE_RULES_ENV, "po_number_required")
+        ruleset = load_rules()
+        # field rules run before the line item scan
+        assert ruleset.names == BUILTIN_RULES[:-1] + ("po_number_required", "line_items_sum_mismatch")
+        assert ruleset.check(_invoice(currency="XXX")) == (
+            "invalid_currency: XXX",
+            "missing_field: payment_terms",
+        )
+    finally:
+        sys.modules.pop(module, None)
+
+
+def test_register_rejects_bad_rules(registry):
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register("totals_mismatch", fields=("net_total",))(lambda invoice: None)
+    with pytest.raises(ValueError, match="unknown invoice fields"):
+        registry.register("po_check", fields=("po_number",))(lambda invoice: None)
+    with pytest.raises(ValueError, match="unknown cost class"):
+        registry.register("po_check", fields=("net_total",), cost="slow")(lambda invoice: None)
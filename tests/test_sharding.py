@@ -0,0 +1,82 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from invoice_qc.cli import app
+from invoice_qc.sharding import Shard, merge_reports
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from synthetic import make_invoice_pdf  # noqa: E402
+
+pytest.importorskip("pdfplumber")
+
+
+@pytest.fixture(scope="module")
+def pdf_dir(tmp_path_factory):
+    folder = tmp_path_factory.mktemp("pdfs")
+    for i in range(8):
+        (folder / f"invoice_{i:02d}.pdf").write_bytes(make_invoice_pdf(i, lines_per_page=3))
+    # the same invoice under other names: duplicates, some in other shards
+    for name in ("copy_a.pdf", "copy_b.pdf", "copy_c.pdf"):
+        (folder / name).write_bytes(make_invoice_pdf(3, lines_per_page=3))
+    return folder
+
+
+def _full_run(pdf_dir, report, *args):
+    result = CliRunner().invoke(app, ["full-run", "--pdf-dir", str(pdf_dir), "--report", str(report), *args])
+    assert result.exit_code in (0, 2), result.output
+    return report
+
+
+def test_shards_partition_the_folder(pdf_dir):
+    names = [path.name for path in pdf_dir.glob("*.pdf")]
+    for count in (1, 2, 3):
+        owners = [[index for index in range(count) if Shard(index, count).contains(name)] for name in names]
+        assert all(len(owner) == 1 for owner in owners)
+    # the duplicates under test really are split across shards
+    copies = ("invoice_03.pdf", "copy_a.pdf", "copy_b.pdf", "copy_c.pdf")
+    assert len({Shard(0, 2).contains(name) for name in copies}) == 2
+
+
+@pytest.mark.parametrize("mode", ["full", "fail_fast"])
+@pytest.mark.parametrize("count", [1, 2, 3])
+def test_merged_shards_match_unsharded_run(pdf_dir, tmp_path, mode, count):
+    expected = _full_run(pdf_dir, tmp_path / "unsharded.json", "--mode", mode).read_bytes()
+    if mode == "full":
+        assert b"anomaly: duplicate_invoice" in expected
+
+    shard_reports = [
+        _full_run(
+            pdf_dir,
+            tmp_path / f"shard_{index}.json",
+            "--mode", mode,
+            "--shard-index", str(index),
+            "--shard-count", str(count),
+        )
+        for index in range(count)
+    ]
+    merged = tmp_path / "merged.json"
+    result = CliRunner().invoke(app, ["merge-reports", *map(str, reversed(shard_reports)), "--output", str(merged)])
+    assert result.exit_code in (0, 2), result.output
+    assert merged.read_bytes() == expected
+
+
+def test_merge_rejects_incomplete_or_mixed_shards(pdf_dir, tmp_path):
+    def shard_report(index, *args):
+        report = tmp_path / f"shard_{index}{'_'.join(args)}.json"
+        _full_run(pdf_dir, report, "--shard-index", str(index), "--shard-count", "3", *args)
+        return json.loads(report.read_bytes())
+
+    reports = [shard_report(index) for index in range(3)]
+    with pytest.raises(ValueError, match="missing"):
+        merge_reports(reports[:2])
+    with pytest.raises(ValueError, match="repeated"):
+        merge_reports(reports + reports[:1])
+    with pytest.raises(ValueError, match="different modes"):
+        merge_reports(reports[:2] + [shard_report(2, "--mode", "fail_fast")])
+    unsharded = json.loads(_full_run(pdf_dir, tmp_path / "all.json").read_bytes())
+    with pytest.raises(ValueError, match="not a shard report"):
+        merge_reports([unsharded])
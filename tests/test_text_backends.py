@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pdfplumber")
+
+from invoice_qc.extractor import _extract_text_from_pdf  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+from synthetic import make_invoice_pdf  # noqa: E402
+
+
+def _both_backends(path):
+    return (
+        _extract_text_from_pdf(path, text_backend="pdfplumber"),
+        _extract_text_from_pdf(path, text_backend="pdfminer"),
+    )
+
+
+@pytest.mark.parametrize("i, pages", [(0, 1), (1, 2), (2, 3), (7, 1)])
+def test_pdfminer_matches_pdfplumber(tmp_path, i, pages):
+    path = tmp_path / "invoice.pdf"
+    path.write_bytes(make_invoice_pdf(i, pages=pages, lines_per_page=12))
+    plumber, miner = _both_backends(path)
+    assert "Net Total" in plumber
+    assert miner == plumber
+
+
+@pytest.mark.parametrize("rotate", [90, 180, 270])
+def test_pdfminer_matches_pdfplumber_on_rotated_pages(tmp_path, rotate):
+    path = tmp_path / "rotated.pdf"
+    path.write_bytes(make_invoice_pdf(3, pages=2, lines_per_page=12, rotate=rotate))
+    plumber, miner = _both_backends(path)
+    assert miner == plumber